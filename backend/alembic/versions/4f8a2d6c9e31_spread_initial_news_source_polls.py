@@ -0,0 +1,50 @@
+"""Spread the first scheduled poll of existing news_sources
+
+Revision ID: 4f8a2d6c9e31
+Revises: 6c2e8f4a1d95
+Create Date: 2026-10-17 21:05:12.674310
+
+"""
+from datetime import datetime, timedelta
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4f8a2d6c9e31'
+down_revision: Union[str, Sequence[str], None] = '6c2e8f4a1d95'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# FETCHER_SCHEDULER_INITIAL_INTERVAL_SECONDS at the time of writing.
+INITIAL_INTERVAL_SECONDS = 3600
+
+news_sources = sa.table(
+    'news_sources',
+    sa.column('id', sa.Integer),
+    sa.column('next_poll_at', sa.DateTime),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Sources never polled are due at once; spread them over one interval so
+    # turning the scheduler on does not fetch every source in the same tick.
+    connection = op.get_bind()
+    source_ids = connection.execute(
+        sa.select(news_sources.c.id).where(news_sources.c.next_poll_at.is_(None)).order_by(news_sources.c.id)
+    ).scalars().all()
+    now = datetime.utcnow()
+    for position, source_id in enumerate(source_ids):
+        offset = timedelta(seconds=INITIAL_INTERVAL_SECONDS * position / len(source_ids))
+        connection.execute(
+            news_sources.update().where(news_sources.c.id == source_id).values(next_poll_at=now + offset)
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # The spread schedule is left in place; it is valid either way.
+    pass
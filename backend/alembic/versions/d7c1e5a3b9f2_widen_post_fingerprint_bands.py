@@ -0,0 +1,42 @@
+"""Widen post_fingerprints bands to 16 bits
+
+Revision ID: d7c1e5a3b9f2
+Revises: b93f4d7a2c61
+Create Date: 2026-10-17 20:12:05.831946
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7c1e5a3b9f2'
+down_revision: Union[str, Sequence[str], None] = 'b93f4d7a2c61'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for band in range(4, 8):
+        op.drop_index(op.f(f'ix_post_fingerprints_band{band}'), table_name='post_fingerprints')
+        op.drop_column('post_fingerprints', f'band{band}')
+    # Fingerprints are unchanged; only the band split is. Masking after the
+    # shift keeps the values unsigned for negative (signed BIGINT) hashes.
+    op.execute(
+        "UPDATE post_fingerprints SET "
+        + ", ".join(f"band{band} = (simhash >> {band * 16}) & 65535" for band in range(4))
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for band in range(4, 8):
+        op.add_column('post_fingerprints', sa.Column(f'band{band}', sa.Integer(), server_default='0', nullable=False))
+        op.create_index(op.f(f'ix_post_fingerprints_band{band}'), 'post_fingerprints', [f'band{band}'], unique=False)
+    op.execute(
+        "UPDATE post_fingerprints SET "
+        + ", ".join(f"band{band} = (simhash >> {band * 8}) & 255" for band in range(8))
+    )
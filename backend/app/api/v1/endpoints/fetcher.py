@@ -1,60 +1,133 @@
 # filepath: backend/app/api/v1/endpoints/fetcher.py
-from fastapi import APIRouter, WebSocket, Depends, WebSocketDisconnect
+from typing import List, Optional
+from fastapi import APIRouter, WebSocket, Depends, WebSocketDisconnect, HTTPException, status
+from fastapi.responses import PlainTextResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-import json
 
 from app.api import deps
 from app.models.user import User, Role
-from app.services.news_fetcher_service import NewsFetcherService
+from app.schemas.post import FetchJobPublic
+from app.services.fetch_jobs import fetch_job_runner, FetchJob
+from app.services.fetch_metrics import fetch_metrics
 
 router = APIRouter()
 
-@router.websocket("/fetch-news")
-async def fetch_news_stream(
-    websocket: WebSocket,
-    db: AsyncSession = Depends(deps.get_db),
-):
+
+async def _authenticate_websocket(websocket: WebSocket, db: AsyncSession) -> Optional[User]:
     """
-    WebSocket endpoint to stream the progress of the news fetching service.
-    
-    Authentication is performed via a JWT token sent as the first message
-    over the WebSocket connection.
+    Authenticates a superadmin via a JWT token sent as the first message over
+    the WebSocket connection. Closes the socket and returns None on failure.
     """
-    await websocket.accept()
-    
-    # 1. Authenticate and authorize the user from the token
     try:
         token = await websocket.receive_text()
         current_user = await deps.get_current_user(db=db, token=token)
         if current_user.role != Role.SUPERADMIN:
             await websocket.close(code=4003, reason="Insufficient permissions")
-            return
+            return None
     except Exception as e:
         await websocket.close(code=4001, reason=f"Authentication failed: {e}")
-        return
+        return None
+    return current_user
 
-    # 2. Instantiate the service and start streaming updates.
-    # The service no longer takes parameters like 'limit' or 'custom_sites'
-    # as it now reads its configuration from the database.
-    service = NewsFetcherService(db=db, superadmin=current_user)
-    
+
+async def _stream_job(websocket: WebSocket, job: FetchJob):
+    """Sends the job's buffered and live events until it completes or the client leaves."""
     try:
-        async for status_update in service.run():
+        async for status_update in job.subscribe():
             # Send each progress update to the client as a JSON string
             await websocket.send_text(status_update.model_dump_json())
-            if status_update.is_complete:
-                break
     except WebSocketDisconnect:
-        print("Client disconnected during fetch process.")
-    except Exception as e:
-        # If an unhandled error occurs in the service, send a final error message
-        error_message = {
-            "stage": "Critical Error", 
-            "progress": 100, 
-            "message": f"An unexpected error occurred: {str(e)}", 
-            "is_complete": True
-        }
-        await websocket.send_text(json.dumps(error_message))
+        # The job keeps running; the client can re-attach later.
+        print(f"Client detached from fetch job {job.id}.")
     finally:
         # Ensure the connection is always closed gracefully
-        await websocket.close()
\ No newline at end of file
+        try:
+            await websocket.close()
+        except RuntimeError:
+            pass
+
+
+@router.post("/fetch-jobs", response_model=FetchJobPublic)
+async def start_fetch_job(
+    current_user: User = Depends(deps.RoleChecker([Role.SUPERADMIN])),
+):
+    """
+    Start a background news fetch, or return the job that is already running.
+    Progress can be followed on the job's events WebSocket.
+    """
+    job = await fetch_job_runner.start(current_user)
+    return job.to_public()
+
+
+@router.get("/fetch-jobs", response_model=List[FetchJobPublic])
+async def list_fetch_jobs(
+    current_user: User = Depends(deps.RoleChecker([Role.SUPERADMIN])),
+):
+    """List recent fetch jobs, newest first."""
+    return [job.to_public() for job in fetch_job_runner.recent_jobs()]
+
+
+@router.get("/fetch-jobs/{job_id}", response_model=FetchJobPublic)
+async def get_fetch_job(
+    job_id: str,
+    current_user: User = Depends(deps.RoleChecker([Role.SUPERADMIN])),
+):
+    """Get the status of a fetch job."""
+    job = fetch_job_runner.get(job_id)
+    if not job:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Fetch job not found")
+    return job.to_public()
+
+
+@router.get("/fetch-metrics", response_class=PlainTextResponse)
+async def get_fetch_metrics(
+    current_user: User = Depends(deps.RoleChecker([Role.SUPERADMIN])),
+):
+    """
+    Latency histograms of the fetch pipeline stages (discovery, fetch,
+    extract, ai, image, upload, persist) by source and outcome, in the
+    Prometheus text format.
+    """
+    return PlainTextResponse(fetch_metrics.render(), media_type="text/plain; version=0.0.4")
+
+
+@router.websocket("/fetch-jobs/{job_id}/events")
+async def fetch_job_events(
+    websocket: WebSocket,
+    job_id: str,
+    db: AsyncSession = Depends(deps.get_db),
+):
+    """
+    WebSocket endpoint to follow a fetch job. Recent events are replayed
+    first, followed by live progress until the job completes.
+    """
+    await websocket.accept()
+    if not await _authenticate_websocket(websocket, db):
+        return
+
+    job = fetch_job_runner.get(job_id)
+    if not job:
+        await websocket.close(code=4004, reason="Fetch job not found")
+        return
+    await _stream_job(websocket, job)
+
+
+@router.websocket("/fetch-news")
+async def fetch_news_stream(
+    websocket: WebSocket,
+    db: AsyncSession = Depends(deps.get_db),
+):
+    """
+    WebSocket endpoint to stream the progress of the news fetching service.
+    
+    Authentication is performed via a JWT token sent as the first message
+    over the WebSocket connection. Starts a background fetch job (or attaches
+    to the running one); disconnecting does not stop the job.
+    """
+    await websocket.accept()
+    current_user = await _authenticate_websocket(websocket, db)
+    if not current_user:
+        return
+
+    job = await fetch_job_runner.start(current_user)
+    await _stream_job(websocket, job)
@@ -9,6 +9,7 @@ from app.api import deps
 from app.models.user import User, Role
 from app.models.news import NewsSource
 from app.schemas import news as news_schema
+from app.services.circuit_breaker import host_breakers
 
 router = APIRouter()
 
@@ -17,9 +18,14 @@ async def get_all_news_sources(
     db: AsyncSession = Depends(deps.get_db),
     current_user: User = Depends(deps.RoleChecker([Role.SUPERADMIN])),
 ):
-    """Retrieve all saved news sources."""
+    """Retrieve all saved news sources, with the state of their circuit breakers."""
     result = await db.execute(select(NewsSource).order_by(NewsSource.name))
-    return result.scalars().all()
+    return [
+        news_schema.NewsSourcePublic.model_validate(source).model_copy(
+            update={"host_circuit_state": host_breakers.state_of(urlparse(source.url).netloc.lower())}
+        )
+        for source in result.scalars().all()
+    ]
 
 @router.post("/", response_model=news_schema.NewsSourcePublic, status_code=status.HTTP_201_CREATED)
 async def create_news_source(
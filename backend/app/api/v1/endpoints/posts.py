@@ -7,6 +7,7 @@ from sqlalchemy.orm import selectinload
 from app.api import deps
 from app.models.user import User, Role, Post
 from app.schemas import post as post_schema
+from app.services.url_index import known_url_index
 
 router = APIRouter()
 
@@ -54,4 +55,6 @@ async def delete_post(
 
     await db.delete(post_to_delete)
     await db.commit()
+    # Let the fetcher pick this article up again on a future run.
+    known_url_index.discard(post_to_delete.source_url)
     return None
\ No newline at end of file
@@ -31,6 +31,113 @@ class Settings(BaseSettings):
     R2_BUCKET_NAME: str = ""
     R2_PUBLIC_URL: str = ""
 
+    # News fetcher pipeline: bounded queue size between stages and the
+    # number of concurrent workers per stage.
+    FETCHER_QUEUE_SIZE: int = 50
+    FETCHER_DISCOVERY_WORKERS: int = 4
+    FETCHER_FETCH_WORKERS: int = 8
+    FETCHER_EXTRACT_WORKERS: int = 2
+    FETCHER_SUMMARIZE_WORKERS: int = 4
+    FETCHER_IMAGE_WORKERS: int = 4
+
+    # Per-host politeness for fetcher requests.
+    FETCHER_MAX_CONNECTIONS_PER_HOST: int = 2
+    FETCHER_MIN_HOST_DELAY_SECONDS: float = 1.0
+    FETCHER_MAX_IN_FLIGHT: int = 16
+    FETCHER_MAX_RETRY_AFTER_SECONDS: float = 120.0
+
+    # The HTTP client shared by all fetch runs: HTTP/2 when the h2 package is
+    # installed, a bounded keep-alive pool, and cached DNS answers.
+    FETCHER_HTTP2: bool = True
+    FETCHER_HTTP_MAX_CONNECTIONS: int = 64
+    FETCHER_HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 32
+    FETCHER_HTTP_KEEPALIVE_SECONDS: float = 60.0
+    FETCHER_DNS_CACHE_TTL_SECONDS: float = 300.0
+
+    # Circuit breakers for failing or slow publishers, per source (kept on
+    # the row) and per host (in process): this many consecutive failures,
+    # slow responses or slow discoveries open the circuit for a cooldown
+    # that doubles on every trip, up to the maximum.
+    FETCHER_CIRCUIT_FAILURE_THRESHOLD: int = 3
+    FETCHER_CIRCUIT_SLOW_SECONDS: float = 10.0
+    FETCHER_CIRCUIT_SLOW_DISCOVERY_SECONDS: float = 30.0
+    FETCHER_CIRCUIT_COOLDOWN_SECONDS: int = 300
+    FETCHER_CIRCUIT_MAX_COOLDOWN_SECONDS: int = 6 * 3600
+
+    # Byte limits for streamed downloads, chosen by response Content-Type.
+    # Larger bodies are aborted as soon as the limit is known to be exceeded.
+    FETCHER_MAX_HTML_BYTES: int = 5 * 1024 * 1024
+    FETCHER_MAX_FEED_BYTES: int = 10 * 1024 * 1024
+    FETCHER_MAX_IMAGE_BYTES: int = 10 * 1024 * 1024
+    FETCHER_MAX_RESPONSE_BYTES: int = 2 * 1024 * 1024
+
+    # Sitemap discovery for sources pointing at a site's homepage: at most
+    # this many child sitemaps (newest first) are read from a sitemap index,
+    # and a site found to have no sitemap is looked up again after this long.
+    FETCHER_SITEMAP_MAX_CHILDREN: int = 3
+    FETCHER_SITEMAP_RECHECK_SECONDS: int = 7 * 24 * 3600
+
+    # Where CPU-bound parsing runs: "process" (shared process pool) or
+    # "thread" (default thread pool). 0 processes means one per CPU core.
+    FETCHER_PARSE_MODE: str = "process"
+    FETCHER_PARSE_PROCESSES: int = 0
+
+    # Batched AI summarization: max articles per request (1 disables
+    # batching), estimated token budget per request, and how long to wait
+    # for a batch to fill up.
+    FETCHER_AI_BATCH_SIZE: int = 5
+    FETCHER_AI_BATCH_TOKEN_BUDGET: int = 16000
+    FETCHER_AI_BATCH_WAIT_SECONDS: float = 2.0
+
+    # Persistent AI summary cache limits.
+    FETCHER_AI_CACHE_MAX_ENTRIES: int = 20000
+    FETCHER_AI_CACHE_MAX_AGE_DAYS: int = 30
+
+    # Articles whose SimHash fingerprints differ in at most this many bits
+    # are treated as copies of the same story (at most 11, see near_duplicates).
+    FETCHER_NEAR_DUPLICATE_MAX_DISTANCE: int = 7
+
+    # Post images are stored as WebP renditions at these widths (for a
+    # srcset) plus a JPEG fallback at the largest one.
+    FETCHER_IMAGE_WIDTHS: List[int] = [320, 640, 1200]
+    FETCHER_IMAGE_WEBP_QUALITY: int = 80
+    FETCHER_IMAGE_JPEG_QUALITY: int = 85
+
+    # Image uploads: a dedicated transfer pool (also the S3 connection pool
+    # size) and retries with exponential backoff before falling back to
+    # local storage.
+    FETCHER_UPLOAD_WORKERS: int = 8
+    FETCHER_UPLOAD_MAX_ATTEMPTS: int = 3
+    FETCHER_UPLOAD_BACKOFF_SECONDS: float = 0.5
+
+    # Rendered placeholder title cards kept in memory (LRU).
+    FETCHER_PLACEHOLDER_CACHE_SIZE: int = 256
+
+    # Pexels fallback images: search results are cached on disk per
+    # normalized query, and live searches are capped per rolling hour
+    # (the API allows 200); beyond that articles get a placeholder.
+    FETCHER_PEXELS_CACHE_DIR: str = ".cache/pexels"
+    FETCHER_PEXELS_CACHE_TTL_SECONDS: int = 7 * 24 * 3600
+    FETCHER_PEXELS_REQUESTS_PER_HOUR: int = 150
+
+    # Buffered post persistence: rows per INSERT and max seconds a post may
+    # wait in the buffer.
+    FETCHER_PERSIST_BATCH_SIZE: int = 20
+    FETCHER_PERSIST_FLUSH_SECONDS: float = 5.0
+
+    # Number of recent FetchStatus events replayed to clients attaching to a job.
+    FETCHER_JOB_EVENT_BUFFER: int = 200
+
+    # Built-in periodic fetching, opt-in. Each source's interval adapts
+    # between the min and max bounds depending on whether its polls yield
+    # new posts.
+    FETCHER_SCHEDULER_ENABLED: bool = False
+    FETCHER_SCHEDULER_TICK_SECONDS: float = 60.0
+    FETCHER_SCHEDULER_INITIAL_INTERVAL_SECONDS: int = 3600
+    FETCHER_SCHEDULER_MIN_INTERVAL_SECONDS: int = 300
+    FETCHER_SCHEDULER_MAX_INTERVAL_SECONDS: int = 6 * 3600
+    FETCHER_SCHEDULER_JITTER: float = 0.1
+
     @model_validator(mode='after')
     def fix_database_url(self) -> 'Settings':
         """
@@ -7,8 +7,8 @@
 from app.models.user import Base  # Assuming your Base is here
 
 # Import all the models to register them with SQLAlchemy's metadata
-from app.models.user import User, Invitation, Post  # noqa
-from app.models.news import NewsSource  # noqa
+from app.models.user import User, Invitation, Post, PostFingerprint  # noqa
+from app.models.news import NewsSource, AISummaryCache, ImageAsset  # noqa
 from app.models.training import Training, Module, Lesson, Attachment  # noqa
 from app.models.progress import UserLessonCompletion # <-- ADD THIS LINE
 
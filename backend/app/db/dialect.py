@@ -0,0 +1,16 @@
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Dialect-specific INSERT constructs that support ON CONFLICT clauses.
+_INSERT_BY_DIALECT = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+
+def upsert_insert(db: AsyncSession, model):
+    """
+    Returns an INSERT for `model` that supports `.on_conflict_do_nothing()` /
+    `.on_conflict_do_update()` on the session's database.
+    """
+    return _INSERT_BY_DIALECT[db.bind.dialect.name](model)
@@ -1,4 +1,5 @@
 # filepath: backend/main.py
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.api.v1.api import api_router
@@ -7,8 +8,29 @@ try:
 except Exception:
     auth_router = None 
 from app.core.config import settings # <-- ADD THIS IMPORT
+from app.services.fetch_jobs import fetch_job_runner
+from app.services.fetch_scheduler import fetch_scheduler
+from app.services.http_transport import close_fetcher_client
+from app.services.object_uploader import object_uploader
+from app.services.parse_pool import shutdown_parse_pool
+from app.services.placeholder_images import placeholder_renderer
 
-app = FastAPI(title="RiskWatch API")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    placeholder_renderer.warm()
+    if settings.FETCHER_SCHEDULER_ENABLED:
+        fetch_scheduler.start()
+    yield
+    # Stop background fetch jobs and release the fetcher's shared resources
+    await fetch_scheduler.stop()
+    await fetch_job_runner.shutdown()
+    await close_fetcher_client()
+    shutdown_parse_pool()
+    object_uploader.shutdown()
+
+
+app = FastAPI(title="RiskWatch API", lifespan=lifespan)
 
 # --- THIS IS THE CHANGE ---
 # Use the configurable origins list from settings
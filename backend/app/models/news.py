@@ -1,6 +1,7 @@
 # filepath: backend/app/models/news.py
-from sqlalchemy import Column, Integer, String, ForeignKey
+from sqlalchemy import Column, Integer, String, ForeignKey, Text, DateTime, JSON
 from sqlalchemy.orm import relationship
+from datetime import datetime
 from .user import Base
 
 class NewsSource(Base):
@@ -12,4 +13,71 @@ class NewsSource(Base):
     url = Column(String, unique=True, index=True, nullable=False)
     author_id = Column(Integer, ForeignKey("users.id"), nullable=False)
 
-    author = relationship("User")
\ No newline at end of file
+    # HTTP cache validators from the last fetch, used for conditional GETs
+    etag = Column(String, nullable=True)
+    last_modified = Column(String, nullable=True)
+    content_hash = Column(String(64), nullable=True)
+
+    # Adaptive polling schedule maintained by the fetch scheduler
+    poll_interval_seconds = Column(Integer, nullable=True)
+    last_polled_at = Column(DateTime, nullable=True)
+    next_poll_at = Column(DateTime, nullable=True, index=True)
+
+    # Sitemap-driven discovery for site homepages: the sitemap found through
+    # robots.txt ("" when the site has none; NULL until looked up), when it
+    # was last looked up, and when discovery last succeeded, so only newer
+    # sitemap entries are taken.
+    sitemap_url = Column(String, nullable=True)
+    sitemap_checked_at = Column(DateTime, nullable=True)
+    last_discovered_at = Column(DateTime, nullable=True)
+
+    # Circuit breaker state (see services.circuit_breaker): consecutive
+    # failed or slow discoveries, the cooldown of the last trip, and when the
+    # source may be probed again.
+    consecutive_failures = Column(Integer, nullable=False, default=0, server_default='0')
+    circuit_cooldown_seconds = Column(Integer, nullable=True)
+    circuit_open_until = Column(DateTime, nullable=True)
+
+    author = relationship("User")
+
+    @property
+    def circuit_state(self) -> str:
+        if not self.circuit_cooldown_seconds:
+            return "closed"
+        if self.circuit_open_until and datetime.utcnow() < self.circuit_open_until:
+            return "open"
+        return "half_open"
+
+
+class AISummaryCache(Base):
+    """
+    Caches AI-generated post content by a hash of the normalized article text
+    and the prompt version, so syndicated or unchanged articles are not sent
+    to the model again.
+    """
+    __tablename__ = "ai_summary_cache"
+
+    content_hash = Column(String(64), primary_key=True)
+    title = Column(String, nullable=False)
+    summary = Column(Text, nullable=False)
+    description = Column(Text, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    last_used_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+
+
+class ImageAsset(Base):
+    """
+    Registry of images already stored for posts. Maps the image's source URL
+    and a hash of its bytes to the stored object URL, so an image reused across
+    articles is downloaded, resized and uploaded only once.
+    """
+    __tablename__ = "image_assets"
+
+    id = Column(Integer, primary_key=True)
+    # Null for generated images, such as placeholders.
+    source_url = Column(String, unique=True, nullable=True)
+    content_hash = Column(String(64), nullable=False, index=True)
+    stored_url = Column(String, nullable=False)
+    # Responsive renditions, as stored on Post.image_variants.
+    variants = Column(JSON, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
@@ -1,6 +1,6 @@
 # filepath: backend/app/models/user.py
 import enum
-from sqlalchemy import Column, Integer, String, Boolean, Enum as SAEnum, DateTime, ForeignKey, Text
+from sqlalchemy import Column, Integer, BigInteger, String, Boolean, Enum as SAEnum, DateTime, ForeignKey, Text, JSON
 from sqlalchemy.orm import relationship, declarative_base
 from datetime import datetime
 
@@ -67,6 +67,8 @@ class Post(Base):
     summary = Column(Text, nullable=False)
     description = Column(Text, nullable=False)
     image_url = Column(String, nullable=False)
+    # [{"url", "width", "format"}, ...] renditions of image_url for a srcset.
+    image_variants = Column(JSON, nullable=True)
     source_name = Column(String, nullable=False)
     source_url = Column(String, unique=True, index=True, nullable=False)
     published_date = Column(DateTime, nullable=True, default=datetime.utcnow)
@@ -74,4 +76,18 @@ class Post(Base):
     is_ai_generated = Column(Boolean, default=True, nullable=False)
     author_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     
-    author = relationship("User", back_populates="posts")
\ No newline at end of file
+    author = relationship("User", back_populates="posts")
+
+
+class PostFingerprint(Base):
+    """
+    SimHash fingerprint of a post's source text, split into LSH bands so
+    near-duplicate articles can be found with indexed band lookups.
+    """
+    __tablename__ = "post_fingerprints"
+    post_id = Column(Integer, ForeignKey("posts.id", ondelete="CASCADE"), primary_key=True)
+    simhash = Column(BigInteger, nullable=False)
+    band0 = Column(Integer, nullable=False, index=True)
+    band1 = Column(Integer, nullable=False, index=True)
+    band2 = Column(Integer, nullable=False, index=True)
+    band3 = Column(Integer, nullable=False, index=True)
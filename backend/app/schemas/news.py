@@ -1,6 +1,7 @@
 # filepath: backend/app/schemas/news.py
 from pydantic import BaseModel, HttpUrl
 from typing import Optional
+from datetime import datetime
 
 class NewsSourceBase(BaseModel):
     url: HttpUrl
@@ -12,6 +13,16 @@ class NewsSourceCreate(NewsSourceBase):
 class NewsSourcePublic(NewsSourceBase):
     id: int
     name: str # Name is not optional on retrieval
+    poll_interval_seconds: Optional[int] = None
+    last_polled_at: Optional[datetime] = None
+    next_poll_at: Optional[datetime] = None
+    sitemap_url: Optional[str] = None
+    last_discovered_at: Optional[datetime] = None
+    circuit_state: str = "closed"
+    consecutive_failures: int = 0
+    circuit_open_until: Optional[datetime] = None
+    # Breaker of the source's host, shared with its article and image fetches.
+    host_circuit_state: str = "closed"
 
     class Config:
         from_attributes = True
\ No newline at end of file
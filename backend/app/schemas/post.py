@@ -1,12 +1,18 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, computed_field
 from datetime import datetime
-from typing import Optional
+from typing import Dict, List, Optional
+
+class ImageVariantPublic(BaseModel):
+    url: str
+    width: int
+    format: str
 
 class PostBase(BaseModel):
     title: str
     summary: str
     description: str
     image_url: str
+    image_variants: Optional[List[ImageVariantPublic]] = None
     source_name: str
     source_url: str
     published_date: Optional[datetime] = None
@@ -20,11 +26,48 @@ class PostPublic(PostBase):
     is_ai_generated: bool
     author_id: int
 
+    @computed_field
+    @property
+    def image_srcset(self) -> Optional[str]:
+        """WebP renditions as an HTML srcset; image_url remains the fallback."""
+        webp = [v for v in self.image_variants or [] if v.format == "webp"]
+        if not webp:
+            return None
+        return ", ".join(f"{v.url} {v.width}w" for v in sorted(webp, key=lambda v: v.width))
+
     class Config:
         from_attributes = True
 
+class StageTiming(BaseModel):
+    """Timings of one pipeline stage over a fetch run."""
+    count: int
+    outcomes: Dict[str, int]
+    total_seconds: float
+    p50_ms: float
+    p95_ms: float
+
 class FetchStatus(BaseModel):
     stage: str
     progress: float
     message: str
-    is_complete: bool = False
\ No newline at end of file
+    is_complete: bool = False
+    # Per-stage timings, on the final event of a run.
+    metrics: Optional[Dict[str, StageTiming]] = None
+
+class UploadStats(BaseModel):
+    """Image upload pool metrics; latencies cover recent uploads, retries included."""
+    queue_depth: int
+    in_flight: int
+    completed: int
+    failed: int
+    retries: int
+    p50_ms: float
+    p95_ms: float
+
+class FetchJobPublic(BaseModel):
+    job_id: str
+    status: str
+    started_at: datetime
+    finished_at: Optional[datetime] = None
+    last_event: Optional[FetchStatus] = None
+    uploads: Optional[UploadStats] = None
@@ -0,0 +1,83 @@
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Optional
+from urllib.parse import urljoin
+
+import trafilatura
+from trafilatura.utils import load_html
+
+from app.services.near_duplicates import simhash
+from app.services.text_decoding import decode_body
+
+# The article's publication time. Only the Open Graph article tag is
+# trusted: looser markers such as the first <time> on the page often date a
+# related link or a comment, and posts are listed by this date.
+PUBLISHED_DATE_XPATH = '//meta[@property="article:published_time"]/@content'
+
+
+@dataclass
+class ArticleDocument:
+    """
+    Everything the pipeline needs from an article page, taken from a single
+    parse. Only plain values are kept so the document is cheap to pass
+    between stages.
+    """
+    url: str
+    content_text: Optional[str] = None
+    title: str = ""
+    og_title: str = ""
+    og_image: Optional[str] = None
+    canonical_url: Optional[str] = None
+    published_date: Optional[datetime] = None
+    simhash: Optional[int] = None
+
+    @property
+    def display_title(self) -> str:
+        return self.title or self.og_title
+
+
+def parse_article(content: bytes, content_type: str, url: str) -> ArticleDocument:
+    """
+    Decodes and parses the page once, reads its metadata and then runs
+    trafilatura on the same tree.
+    """
+    doc = ArticleDocument(url=url)
+    tree = load_html(decode_body(content, content_type))
+    if tree is None:
+        return doc
+
+    # Metadata is read first: trafilatura prunes the tree while extracting.
+    doc.title = _first(tree.xpath('//title/text()'))
+    doc.og_title = _first(tree.xpath('//meta[@property="og:title"]/@content'))
+    og_image = _first(tree.xpath('//meta[@property="og:image"]/@content'))
+    doc.og_image = urljoin(url, og_image) if og_image else None
+    canonical = _first(tree.xpath('//link[@rel="canonical"]/@href'))
+    doc.canonical_url = urljoin(url, canonical) if canonical else None
+    doc.published_date = _published_date(tree)
+
+    doc.content_text = trafilatura.extract(tree, include_comments=False, include_tables=False)
+    if doc.content_text:
+        doc.simhash = simhash(doc.content_text)
+    return doc
+
+
+def _first(values) -> str:
+    for value in values:
+        value = str(value).strip()
+        if value:
+            return value
+    return ""
+
+
+def _published_date(tree) -> Optional[datetime]:
+    value = _first(tree.xpath(PUBLISHED_DATE_XPATH))
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    # Posts store naive UTC timestamps.
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
@@ -0,0 +1,125 @@
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Optional
+
+from app.core.config import settings
+from app.models.news import NewsSource
+
+CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+
+class CircuitOpen(Exception):
+    """Raised instead of sending a request to a host whose circuit is open."""
+
+
+def next_cooldown(previous: Optional[float]) -> float:
+    """Cooldown after a trip: the base cooldown, doubling on every consecutive trip."""
+    if not previous:
+        return settings.FETCHER_CIRCUIT_COOLDOWN_SECONDS
+    return min(previous * 2, settings.FETCHER_CIRCUIT_MAX_COOLDOWN_SECONDS)
+
+
+class CircuitBreaker:
+    """
+    Breaker for one host. After `failure_threshold` consecutive failures
+    (errors, 5xx answers or responses slower than `slow_threshold`) the
+    circuit opens for a cooldown that doubles with every trip. Once the
+    cooldown has passed, a single probe request is let through: its success
+    closes the circuit, its failure opens it again.
+    """
+
+    def __init__(self, failure_threshold: int, slow_threshold: float, clock: Callable[[], float] = time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.slow_threshold = slow_threshold
+        self._clock = clock
+        self.failures = 0
+        self.cooldown: Optional[float] = None
+        self.open_until = 0.0
+        self._probing = False
+
+    @property
+    def state(self) -> str:
+        if self.cooldown is None:
+            return CLOSED
+        return OPEN if self._clock() < self.open_until else HALF_OPEN
+
+    def allow(self) -> bool:
+        """Whether a request may be sent now; claims the probe when half-open."""
+        state = self.state
+        if state == CLOSED:
+            return True
+        if state == OPEN or self._probing:
+            return False
+        self._probing = True
+        return True
+
+    def record(self, ok: bool, latency: float = 0.0):
+        self._probing = False
+        if ok and latency <= self.slow_threshold:
+            self.failures = 0
+            self.cooldown = None
+            return
+        self.failures += 1
+        # A failed probe re-opens at once; otherwise trip at the threshold.
+        if self.cooldown is not None or self.failures >= self.failure_threshold:
+            self.cooldown = next_cooldown(self.cooldown)
+            self.open_until = self._clock() + self.cooldown
+
+    def abandon(self):
+        """Releases the probe of a request that ended without a verdict (e.g. cancelled)."""
+        self._probing = False
+
+
+class HostCircuitBreakers:
+    """Circuit breakers by host, kept for the life of the process."""
+
+    def __init__(self, failure_threshold: int, slow_threshold: float):
+        self.failure_threshold = failure_threshold
+        self.slow_threshold = slow_threshold
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+    def get(self, host: str) -> CircuitBreaker:
+        breaker = self._breakers.get(host)
+        if breaker is None:
+            breaker = self._breakers[host] = CircuitBreaker(self.failure_threshold, self.slow_threshold)
+        return breaker
+
+    def state_of(self, host: str) -> str:
+        breaker = self._breakers.get(host)
+        return breaker.state if breaker else CLOSED
+
+
+def source_circuit_allows(source: NewsSource, now: Optional[datetime] = None) -> bool:
+    """
+    Whether a source should be polled. Its breaker lives on the row, so it
+    survives restarts; each run polls a source once, so a run reaching a
+    source whose cooldown has passed is its half-open probe.
+    """
+    now = now or datetime.utcnow()
+    return source.circuit_open_until is None or source.circuit_open_until <= now
+
+
+def record_source_result(source: NewsSource, ok: bool, latency: float = 0.0, now: Optional[datetime] = None):
+    """
+    Updates a source's breaker after discovery, like CircuitBreaker.record.
+    `latency` is the whole discovery (robots.txt, sitemaps, politeness
+    delays included), hence its own, more generous slow threshold.
+    """
+    now = now or datetime.utcnow()
+    if ok and latency <= settings.FETCHER_CIRCUIT_SLOW_DISCOVERY_SECONDS:
+        source.consecutive_failures = 0
+        source.circuit_cooldown_seconds = None
+        source.circuit_open_until = None
+        return
+    source.consecutive_failures = (source.consecutive_failures or 0) + 1
+    if source.circuit_cooldown_seconds or source.consecutive_failures >= settings.FETCHER_CIRCUIT_FAILURE_THRESHOLD:
+        cooldown = int(next_cooldown(source.circuit_cooldown_seconds))
+        source.circuit_cooldown_seconds = cooldown
+        source.circuit_open_until = now + timedelta(seconds=cooldown)
+
+
+# Shared by every fetch run in this process.
+host_breakers = HostCircuitBreakers(
+    failure_threshold=settings.FETCHER_CIRCUIT_FAILURE_THRESHOLD,
+    slow_threshold=settings.FETCHER_CIRCUIT_SLOW_SECONDS,
+)
@@ -0,0 +1,143 @@
+import asyncio
+import uuid
+from collections import OrderedDict, deque
+from contextlib import suppress
+from datetime import datetime
+from typing import AsyncGenerator, Deque, List, Optional, Set
+
+from app.core.config import settings
+from app.db.session import AsyncSessionLocal
+from app.models.user import User
+from app.schemas.post import FetchStatus, FetchJobPublic, UploadStats
+from app.services.news_fetcher_service import NewsFetcherService
+from app.services.object_uploader import object_uploader
+
+
+class FetchJob:
+    """A single news fetch run, executing independently of any client connection."""
+
+    def __init__(self, started_by_id: int, buffer_size: int, source_ids: Optional[List[int]] = None):
+        self.id = uuid.uuid4().hex
+        self.started_by_id = started_by_id
+        # None means every saved source.
+        self.source_ids = source_ids
+        self.status = "running"
+        self.started_at = datetime.utcnow()
+        self.finished_at: Optional[datetime] = None
+        # Recent events, replayed to clients that attach mid-run.
+        self.events: Deque[FetchStatus] = deque(maxlen=buffer_size)
+        self._subscribers: Set[asyncio.Queue] = set()
+        self.task: Optional[asyncio.Task] = None
+        # Upload pool metrics as of the end of the job; live while running.
+        self.upload_stats: Optional[UploadStats] = None
+
+    @property
+    def is_running(self) -> bool:
+        return self.status == "running"
+
+    def publish(self, event: FetchStatus):
+        self.events.append(event)
+        for queue in self._subscribers:
+            queue.put_nowait(event)
+
+    async def subscribe(self) -> AsyncGenerator[FetchStatus, None]:
+        """Yields the buffered events, then live ones until the job completes."""
+        queue: asyncio.Queue = asyncio.Queue()
+        # Snapshot and registration happen without an await in between, so
+        # no event can be missed or delivered twice.
+        replay = list(self.events)
+        if self.is_running:
+            self._subscribers.add(queue)
+        try:
+            for event in replay:
+                yield event
+                if event.is_complete:
+                    return
+            while self.is_running or not queue.empty():
+                event = await queue.get()
+                yield event
+                if event.is_complete:
+                    return
+        finally:
+            self._subscribers.discard(queue)
+
+    def to_public(self) -> FetchJobPublic:
+        return FetchJobPublic(
+            job_id=self.id, status=self.status, started_at=self.started_at,
+            finished_at=self.finished_at, last_event=self.events[-1] if self.events else None,
+            uploads=object_uploader.stats() if self.is_running else self.upload_stats,
+        )
+
+
+class FetchJobRunner:
+    """
+    Runs fetch jobs in the background of this process. At most one job runs
+    at a time: starting a fetch while one is active returns the active job,
+    so several watchers never duplicate work.
+    """
+
+    def __init__(self, buffer_size: int, history_size: int = 20):
+        self.buffer_size = buffer_size
+        self.history_size = history_size
+        self._jobs: "OrderedDict[str, FetchJob]" = OrderedDict()
+        self._lock = asyncio.Lock()
+
+    @property
+    def active_job(self) -> Optional[FetchJob]:
+        for job in reversed(self._jobs.values()):
+            if job.is_running:
+                return job
+        return None
+
+    def get(self, job_id: str) -> Optional[FetchJob]:
+        return self._jobs.get(job_id)
+
+    def recent_jobs(self) -> List[FetchJob]:
+        return list(reversed(self._jobs.values()))
+
+    async def start(self, superadmin: User, source_ids: Optional[List[int]] = None) -> FetchJob:
+        """Starts a new job, or returns the one already running."""
+        async with self._lock:
+            job = self.active_job
+            if job is not None:
+                return job
+            job = FetchJob(started_by_id=superadmin.id, buffer_size=self.buffer_size, source_ids=source_ids)
+            self._jobs[job.id] = job
+            while len(self._jobs) > self.history_size:
+                self._jobs.popitem(last=False)
+            job.task = asyncio.create_task(self._run(job))
+            return job
+
+    async def _run(self, job: FetchJob):
+        # The job owns its DB session; it must not borrow the request's.
+        try:
+            async with AsyncSessionLocal() as db:
+                superadmin = await db.get(User, job.started_by_id)
+                service = NewsFetcherService(db=db, superadmin=superadmin)
+                async for status_update in service.run(source_ids=job.source_ids):
+                    job.publish(status_update)
+            job.status = "completed"
+        except asyncio.CancelledError:
+            job.status = "cancelled"
+            job.publish(FetchStatus(stage="Cancelled", progress=100, message="The fetch job was cancelled.", is_complete=True))
+            raise
+        except Exception as e:
+            job.status = "failed"
+            job.publish(FetchStatus(
+                stage="Critical Error", progress=100,
+                message=f"An unexpected error occurred: {str(e)}", is_complete=True
+            ))
+        finally:
+            job.finished_at = datetime.utcnow()
+            job.upload_stats = object_uploader.stats()
+
+    async def shutdown(self):
+        """Cancels running jobs; called when the application stops."""
+        for job in list(self._jobs.values()):
+            if job.task and not job.task.done():
+                job.task.cancel()
+                with suppress(asyncio.CancelledError):
+                    await job.task
+
+
+fetch_job_runner = FetchJobRunner(buffer_size=settings.FETCHER_JOB_EVENT_BUFFER)
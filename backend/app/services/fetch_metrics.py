@@ -0,0 +1,143 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Tuple
+
+from app.schemas.post import StageTiming
+
+# Pipeline stages that are timed, in pipeline order.
+STAGES = ("discovery", "fetch", "extract", "ai", "image", "upload", "persist")
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+METRIC_NAME = "riskwatch_fetch_stage_seconds"
+
+# Name of the source the current pipeline task is working for; stage
+# workers set it so nested timers (e.g. uploads) are labelled correctly.
+metrics_source: ContextVar[str] = ContextVar("metrics_source", default="")
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+
+@dataclass
+class _Series:
+    bucket_counts: List[int]
+    total: float = 0.0
+    count: int = 0
+
+
+class FetchMetrics:
+    """
+    Process-wide latency histograms for the fetch pipeline, labelled by
+    stage, source and outcome, rendered in the Prometheus text format.
+    """
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self._series: Dict[Tuple[str, str, str], _Series] = {}
+
+    def observe(self, stage: str, source: str, outcome: str, seconds: float):
+        series = self._series.get((stage, source, outcome))
+        if series is None:
+            series = self._series[(stage, source, outcome)] = _Series([0] * len(self.buckets))
+        for i, bound in enumerate(self.buckets):
+            if seconds <= bound:
+                series.bucket_counts[i] += 1
+        series.total += seconds
+        series.count += 1
+
+    def render(self) -> str:
+        lines = [
+            f"# HELP {METRIC_NAME} Time spent in each fetch pipeline stage, per article (per source for discovery).",
+            f"# TYPE {METRIC_NAME} histogram",
+        ]
+        for (stage, source, outcome), series in sorted(self._series.items()):
+            labels = f'stage="{_escape(stage)}",source="{_escape(source)}",outcome="{_escape(outcome)}"'
+            for bound, count in zip(self.buckets, series.bucket_counts):
+                lines.append(f'{METRIC_NAME}_bucket{{{labels},le="{bound}"}} {count}')
+            lines.append(f'{METRIC_NAME}_bucket{{{labels},le="+Inf"}} {series.count}')
+            lines.append(f"{METRIC_NAME}_sum{{{labels}}} {series.total}")
+            lines.append(f"{METRIC_NAME}_count{{{labels}}} {series.count}")
+        return "\n".join(lines) + "\n"
+
+
+class _Timing:
+    def __init__(self):
+        self.outcome = "ok"
+
+
+@dataclass
+class RunMetrics:
+    """
+    One fetch run's view of the metrics: observations go to the process-wide
+    histograms and are also kept here to summarize the run.
+    """
+    registry: FetchMetrics
+    _samples: Dict[str, List[float]] = field(default_factory=dict)
+    _outcomes: Dict[str, Dict[str, int]] = field(default_factory=dict)
+
+    def observe(self, stage: str, source: str, outcome: str, seconds: float):
+        self.registry.observe(stage, source, outcome, seconds)
+        self._samples.setdefault(stage, []).append(seconds)
+        outcomes = self._outcomes.setdefault(stage, {})
+        outcomes[outcome] = outcomes.get(outcome, 0) + 1
+
+    @contextmanager
+    def time(self, stage: str, source: str = None) -> Iterator[_Timing]:
+        """
+        Times the block. The outcome defaults to "ok", becomes "error" if the
+        block raises, and can be set by the caller through the yielded object.
+        """
+        timing = _Timing()
+        started = time.perf_counter()
+        try:
+            yield timing
+        except BaseException:
+            timing.outcome = "error"
+            raise
+        finally:
+            source = metrics_source.get() if source is None else source
+            self.observe(stage, source, timing.outcome, time.perf_counter() - started)
+
+    @contextmanager
+    def time_batch(self, stage: str, sources: List[str]) -> Iterator[List[_Timing]]:
+        """
+        Times a block processing several articles at once (one per source
+        entry); each is observed with the whole block's duration, since
+        every article waited that long.
+        """
+        timings = [_Timing() for _ in sources]
+        started = time.perf_counter()
+        try:
+            yield timings
+        except BaseException:
+            for timing in timings:
+                timing.outcome = "error"
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            for source, timing in zip(sources, timings):
+                self.observe(stage, source, timing.outcome, elapsed)
+
+    def summary(self) -> Dict[str, StageTiming]:
+        result = {}
+        for stage in STAGES:
+            samples = sorted(self._samples.get(stage, []))
+            if not samples:
+                continue
+            result[stage] = StageTiming(
+                count=len(samples), outcomes=dict(self._outcomes[stage]),
+                total_seconds=round(sum(samples), 3),
+                p50_ms=percentile(samples, 0.50) * 1000, p95_ms=percentile(samples, 0.95) * 1000,
+            )
+        return result
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+fetch_metrics = FetchMetrics()
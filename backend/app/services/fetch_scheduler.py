@@ -0,0 +1,68 @@
+import asyncio
+from contextlib import suppress
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import select, or_
+
+from app.core.config import settings
+from app.db.session import AsyncSessionLocal
+from app.models.news import NewsSource
+from app.models.user import User, Role
+from app.services.fetch_jobs import fetch_job_runner
+
+
+class FetchScheduler:
+    """
+    Background loop that periodically starts a fetch job for the sources
+    whose next poll time has come. Jobs go through the shared job runner, so
+    scheduled runs never overlap with manual ones.
+    """
+
+    def __init__(self, tick_seconds: float):
+        self.tick_seconds = tick_seconds
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._loop())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    async def _loop(self):
+        while True:
+            try:
+                await self.tick()
+            except Exception as e:
+                print(f"News fetch scheduler tick failed: {e}")
+            await asyncio.sleep(self.tick_seconds)
+
+    async def tick(self):
+        """Starts a job for all due sources, unless a fetch is already running."""
+        if fetch_job_runner.active_job is not None:
+            return
+        async with AsyncSessionLocal() as db:
+            now = datetime.utcnow()
+            result = await db.execute(
+                select(NewsSource.id).where(or_(NewsSource.next_poll_at.is_(None), NewsSource.next_poll_at <= now))
+            )
+            due_ids = list(result.scalars().all())
+            if not due_ids:
+                return
+            # Scheduled posts are attributed to a superadmin, as manual ones are.
+            result = await db.execute(
+                select(User).where(User.role == Role.SUPERADMIN, User.is_active == True).order_by(User.id).limit(1)
+            )
+            superadmin = result.scalar_one_or_none()
+        if superadmin is None:
+            print("News fetch scheduler: no active superadmin to attribute posts to.")
+            return
+        await fetch_job_runner.start(superadmin, source_ids=due_ids)
+
+
+fetch_scheduler = FetchScheduler(tick_seconds=settings.FETCHER_SCHEDULER_TICK_SECONDS)
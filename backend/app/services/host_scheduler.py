@@ -0,0 +1,194 @@
+import asyncio
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+import httpx
+
+from app.services.circuit_breaker import OPEN, CircuitBreaker, CircuitOpen, HostCircuitBreakers
+
+# Status codes that mean "slow down" rather than "this request is broken".
+THROTTLE_STATUS_CODES = {429, 503}
+
+# Headers describing the wire encoding of a body we have already decoded.
+_ENCODING_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+
+class ResponseTooLarge(Exception):
+    """Raised when a response body exceeds the byte limit for its content type."""
+
+
+class _HostState:
+    """Politeness bookkeeping for a single host."""
+
+    def __init__(self, max_connections: int):
+        self.connections = asyncio.Semaphore(max_connections)
+        # Serializes the spacing check so request starts are at least
+        # `min_delay` apart, even with several connections open.
+        self.spacing_lock = asyncio.Lock()
+        self.next_allowed_at = 0.0
+
+
+class HostScheduler:
+    """
+    Wraps an httpx.AsyncClient so that outgoing GETs respect per-host limits:
+    a maximum number of concurrent connections, a minimum delay between
+    request starts, and any Retry-After the host sends back. A global cap
+    bounds the total number of requests in flight across all hosts.
+
+    Bodies are streamed and capped by content type (`byte_limits` maps a
+    content-type prefix such as "image/" to a maximum size), so a single
+    huge page or image cannot exhaust memory.
+
+    With `breakers`, requests to a host whose circuit is open fail at once
+    with CircuitOpen instead of waiting out timeouts.
+    """
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        max_connections_per_host: int = 2,
+        min_host_delay: float = 1.0,
+        max_in_flight: int = 16,
+        max_retries: int = 2,
+        max_retry_after: float = 120.0,
+        byte_limits: Optional[Dict[str, int]] = None,
+        default_byte_limit: Optional[int] = None,
+        breakers: Optional[HostCircuitBreakers] = None,
+    ):
+        self.client = client
+        self.max_connections_per_host = max_connections_per_host
+        self.min_host_delay = min_host_delay
+        self.max_retries = max_retries
+        self.max_retry_after = max_retry_after
+        self.byte_limits = byte_limits or {}
+        self.default_byte_limit = default_byte_limit
+        self.breakers = breakers
+        self._in_flight = asyncio.Semaphore(max_in_flight)
+        self._hosts: Dict[str, _HostState] = {}
+
+    async def get(self, url: str, max_bytes: Optional[int] = None, **kwargs) -> httpx.Response:
+        """
+        Performs a scheduled GET, retrying throttled responses after the
+        advertised delay. `max_bytes` overrides the content-type byte limit.
+        The host's circuit breaker, if any, sees one outcome per call, after
+        any retries: a 503 with Retry-After is the host asking for patience,
+        not failing.
+        """
+        breaker = self.breakers.get(urlparse(url).netloc.lower()) if self.breakers else None
+        if breaker is None:
+            response, _ = await self._get_with_retries(None, url, max_bytes, **kwargs)
+            return response
+        if not breaker.allow():
+            raise CircuitOpen(f"Circuit open for {urlparse(url).netloc}")
+        try:
+            response, latency = await self._get_with_retries(breaker, url, max_bytes, **kwargs)
+        except httpx.TransportError:
+            breaker.record(ok=False)
+            raise
+        except BaseException:
+            # Not the host's fault (e.g. an oversized body), cancelled, or the
+            # circuit opened while this request waited for its turn.
+            breaker.abandon()
+            raise
+        breaker.record(ok=response.status_code < 500, latency=latency)
+        return response
+
+    async def _get_with_retries(self, breaker: Optional[CircuitBreaker], url: str, max_bytes: Optional[int],
+                                **kwargs) -> Tuple[httpx.Response, float]:
+        """Returns the last response and how long its own download took."""
+        host = self._host_state(url)
+        loop = asyncio.get_running_loop()
+        attempt = 0
+        while True:
+            async with host.connections:
+                await self._wait_for_turn(host)
+                if breaker is not None and breaker.state == OPEN:
+                    # Other requests tripped the breaker while this one waited.
+                    raise CircuitOpen(f"Circuit open for {urlparse(url).netloc}")
+                # The global slot is only taken once the host is ready, so
+                # requests waiting on a slow host never starve the others.
+                async with self._in_flight:
+                    started = loop.time()
+                    response = await self._download(url, max_bytes, **kwargs)
+                    latency = loop.time() - started
+
+            if response.status_code not in THROTTLE_STATUS_CODES or attempt >= self.max_retries:
+                return response, latency
+
+            attempt += 1
+            delay = self._retry_after_seconds(response)
+            if delay is None:
+                delay = self.min_host_delay * (2 ** attempt)
+            self._defer_host(host, delay)
+
+    async def _download(self, url: str, max_bytes: Optional[int], **kwargs) -> httpx.Response:
+        """Streams the body, aborting as soon as it is known to exceed its byte limit."""
+        request = self.client.build_request("GET", url, **kwargs)
+        response = await self.client.send(request, stream=True)
+        try:
+            limit = max_bytes if max_bytes is not None else self._byte_limit(response)
+            declared = response.headers.get("content-length", "")
+            if limit is not None and declared.isdigit() and int(declared) > limit:
+                raise ResponseTooLarge(f"{url} declares {declared} bytes (limit {limit})")
+            chunks, size = [], 0
+            async for chunk in response.aiter_bytes():
+                size += len(chunk)
+                if limit is not None and size > limit:
+                    raise ResponseTooLarge(f"{url} exceeded {limit} bytes")
+                chunks.append(chunk)
+        finally:
+            await response.aclose()
+
+        # Hand back a regular, fully-read response. The body is already
+        # decompressed, so the wire-encoding headers are dropped.
+        headers = [(k, v) for k, v in response.headers.multi_items() if k.lower() not in _ENCODING_HEADERS]
+        return httpx.Response(
+            response.status_code, headers=headers, content=b"".join(chunks),
+            request=response.request, history=response.history,
+        )
+
+    def _byte_limit(self, response: httpx.Response) -> Optional[int]:
+        content_type = response.headers.get("content-type", "").lower()
+        for prefix, limit in self.byte_limits.items():
+            if content_type.startswith(prefix):
+                return limit
+        return self.default_byte_limit
+
+    def _host_state(self, url: str) -> _HostState:
+        netloc = urlparse(url).netloc.lower()
+        if netloc not in self._hosts:
+            self._hosts[netloc] = _HostState(self.max_connections_per_host)
+        return self._hosts[netloc]
+
+    async def _wait_for_turn(self, host: _HostState):
+        loop = asyncio.get_running_loop()
+        async with host.spacing_lock:
+            wait = host.next_allowed_at - loop.time()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            host.next_allowed_at = max(host.next_allowed_at, loop.time() + self.min_host_delay)
+
+    def _defer_host(self, host: _HostState, delay: float):
+        """Pushes back every pending request to a host, e.g. after a 429."""
+        loop = asyncio.get_running_loop()
+        delay = min(delay, self.max_retry_after)
+        host.next_allowed_at = max(host.next_allowed_at, loop.time() + delay)
+
+    @staticmethod
+    def _retry_after_seconds(response: httpx.Response) -> Optional[float]:
+        """Parses a Retry-After header given either in seconds or as an HTTP date."""
+        value = response.headers.get("retry-after")
+        if not value:
+            return None
+        value = value.strip()
+        if value.isdigit():
+            return float(value)
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
@@ -0,0 +1,222 @@
+import asyncio
+import contextlib
+import ipaddress
+import socket
+import time
+import typing
+from typing import Dict, List, Optional, Tuple
+
+import httpcore
+import httpx
+
+from app.core.config import settings
+
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+FETCHER_USER_AGENT = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) '
+    'Chrome/91.0.4472.124 Safari/537.36'
+)
+
+
+class CachingResolverBackend(httpcore.AsyncNetworkBackend):
+    """
+    Network backend that resolves hostnames through an in-process cache
+    before connecting. TLS still verifies against (and sends SNI for) the
+    original hostname: httpcore passes it to start_tls separately.
+    """
+
+    def __init__(self, backend: httpcore.AsyncNetworkBackend, ttl: float, max_entries: int = 1024):
+        self._backend = backend
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._cache: Dict[str, Tuple[float, List[str]]] = {}
+        self._pending: Dict[str, asyncio.Future] = {}
+        self.hits = 0
+        self.misses = 0
+
+    async def connect_tcp(
+        self, host: str, port: int, timeout: Optional[float] = None,
+        local_address: Optional[str] = None, socket_options: Optional[typing.Iterable] = None,
+    ) -> httpcore.AsyncNetworkStream:
+        error: Optional[Exception] = None
+        for address in await self.resolve(host, port):
+            try:
+                return await self._backend.connect_tcp(address, port, timeout, local_address, socket_options)
+            except (httpcore.ConnectError, httpcore.ConnectTimeout) as e:
+                error = e
+        # Every cached address failed; the next attempt resolves afresh.
+        self._cache.pop(host, None)
+        raise error
+
+    async def resolve(self, host: str, port: int) -> List[str]:
+        if _is_ip_address(host):
+            return [host]
+        entry = self._cache.get(host)
+        if entry is not None and entry[0] > time.monotonic():
+            self.hits += 1
+            return entry[1]
+
+        # Concurrent connects to the same host share one lookup. It is
+        # shielded so a waiter that is cancelled (e.g. its request timed out)
+        # does not cancel the lookup for the others.
+        lookup = self._pending.get(host)
+        if lookup is None:
+            self.misses += 1
+            lookup = self._pending[host] = asyncio.ensure_future(self._lookup(host, port))
+            lookup.add_done_callback(lambda _: self._pending.pop(host, None))
+        return await asyncio.shield(lookup)
+
+    async def _lookup(self, host: str, port: int) -> List[str]:
+        loop = asyncio.get_running_loop()
+        try:
+            infos = await loop.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+        except socket.gaierror as e:
+            raise httpcore.ConnectError(str(e)) from e
+        addresses = list(dict.fromkeys(info[4][0] for info in infos))
+        if len(self._cache) >= self.max_entries:
+            self._cache.clear()
+        self._cache[host] = (time.monotonic() + self.ttl, addresses)
+        return addresses
+
+    async def connect_unix_socket(self, path: str, timeout: Optional[float] = None, socket_options=None):
+        return await self._backend.connect_unix_socket(path, timeout, socket_options)
+
+    async def sleep(self, seconds: float) -> None:
+        await self._backend.sleep(seconds)
+
+
+# httpcore errors and the httpx errors they surface as, most specific first.
+_HTTPCORE_ERRORS = (
+    (httpcore.ConnectTimeout, httpx.ConnectTimeout),
+    (httpcore.ReadTimeout, httpx.ReadTimeout),
+    (httpcore.WriteTimeout, httpx.WriteTimeout),
+    (httpcore.PoolTimeout, httpx.PoolTimeout),
+    (httpcore.TimeoutException, httpx.TimeoutException),
+    (httpcore.ConnectError, httpx.ConnectError),
+    (httpcore.ReadError, httpx.ReadError),
+    (httpcore.WriteError, httpx.WriteError),
+    (httpcore.NetworkError, httpx.NetworkError),
+    (httpcore.ProxyError, httpx.ProxyError),
+    (httpcore.UnsupportedProtocol, httpx.UnsupportedProtocol),
+    (httpcore.LocalProtocolError, httpx.LocalProtocolError),
+    (httpcore.RemoteProtocolError, httpx.RemoteProtocolError),
+    (httpcore.ProtocolError, httpx.ProtocolError),
+)
+
+
+@contextlib.contextmanager
+def _httpx_errors(request: httpx.Request):
+    try:
+        yield
+    except Exception as e:
+        for httpcore_error, httpx_error in _HTTPCORE_ERRORS:
+            if isinstance(e, httpcore_error):
+                raise httpx_error(str(e), request=request) from e
+        raise
+
+
+class _ResponseStream(httpx.AsyncByteStream):
+    def __init__(self, stream: typing.AsyncIterable[bytes], request: httpx.Request):
+        self._stream = stream
+        self._request = request
+
+    async def __aiter__(self) -> typing.AsyncIterator[bytes]:
+        with _httpx_errors(self._request):
+            async for chunk in self._stream:
+                yield chunk
+
+    async def aclose(self) -> None:
+        with _httpx_errors(self._request):
+            await self._stream.aclose()
+
+
+class FetcherTransport(httpx.AsyncBaseTransport):
+    """
+    An httpcore connection pool, using the caching resolver, behind httpx's
+    transport interface. Requests and responses are mapped the same way
+    httpx's own AsyncHTTPTransport maps them.
+    """
+
+    def __init__(self, limits: httpx.Limits, http2: bool, dns_ttl: float):
+        self.resolver = CachingResolverBackend(httpcore.AnyIOBackend(), ttl=dns_ttl)
+        self.pool = httpcore.AsyncConnectionPool(
+            ssl_context=httpx.create_ssl_context(),
+            max_connections=limits.max_connections,
+            max_keepalive_connections=limits.max_keepalive_connections,
+            keepalive_expiry=limits.keepalive_expiry,
+            http1=True,
+            http2=http2,
+            network_backend=self.resolver,
+        )
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        core_request = httpcore.Request(
+            method=request.method,
+            url=httpcore.URL(
+                scheme=request.url.raw_scheme,
+                host=request.url.raw_host,
+                port=request.url.port,
+                target=request.url.raw_path,
+            ),
+            headers=request.headers.raw,
+            content=request.stream,
+            extensions=request.extensions,
+        )
+        with _httpx_errors(request):
+            core_response = await self.pool.handle_async_request(core_request)
+        return httpx.Response(
+            status_code=core_response.status,
+            headers=core_response.headers,
+            stream=_ResponseStream(core_response.stream, request),
+            extensions=core_response.extensions,
+        )
+
+    async def aclose(self) -> None:
+        await self.pool.aclose()
+
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_fetcher_client() -> httpx.AsyncClient:
+    """
+    The HTTP client shared by every fetch run in this process, created on
+    first use. Reusing it keeps connections (and DNS answers) warm between
+    runs; it is closed when the application shuts down.
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        transport = FetcherTransport(
+            limits=httpx.Limits(
+                max_connections=settings.FETCHER_HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.FETCHER_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=settings.FETCHER_HTTP_KEEPALIVE_SECONDS,
+            ),
+            http2=settings.FETCHER_HTTP2 and HTTP2_AVAILABLE,
+            dns_ttl=settings.FETCHER_DNS_CACHE_TTL_SECONDS,
+        )
+        _client = httpx.AsyncClient(
+            transport=transport, timeout=20.0, follow_redirects=True,
+            headers={'User-Agent': FETCHER_USER_AGENT},
+        )
+    return _client
+
+
+async def close_fetcher_client():
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+def _is_ip_address(host: str) -> bool:
+    try:
+        ipaddress.ip_address(host)
+        return True
+    except ValueError:
+        return False
@@ -0,0 +1,47 @@
+import hashlib
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.dialect import upsert_insert
+from app.models.news import ImageAsset
+from app.services.image_variants import StoredImage
+
+
+def image_content_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+async def find_image_by_url(db: AsyncSession, source_url: str) -> Optional[StoredImage]:
+    """Returns the stored copy of an image previously downloaded from `source_url`."""
+    result = await db.execute(
+        select(ImageAsset.stored_url, ImageAsset.variants).where(ImageAsset.source_url == source_url)
+    )
+    return _stored_image(result.first())
+
+
+async def find_image_by_hash(db: AsyncSession, content_hash: str) -> Optional[StoredImage]:
+    """Returns the stored copy of an image with identical bytes, whatever its source."""
+    result = await db.execute(
+        select(ImageAsset.stored_url, ImageAsset.variants).where(ImageAsset.content_hash == content_hash).limit(1)
+    )
+    return _stored_image(result.first())
+
+
+async def register_image(db: AsyncSession, source_url: Optional[str], content_hash: str, image: StoredImage):
+    """Records a stored image; a source URL registered concurrently is left as is."""
+    await db.execute(
+        upsert_insert(db, ImageAsset).values(
+            source_url=source_url, content_hash=content_hash, stored_url=image.url,
+            variants=image.variants, created_at=datetime.utcnow(),
+        ).on_conflict_do_nothing(index_elements=["source_url"])
+    )
+
+
+def _stored_image(row) -> Optional[StoredImage]:
+    if row is None:
+        return None
+    stored_url, variants = row
+    return StoredImage(url=stored_url, variants=variants or [])
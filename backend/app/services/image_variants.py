@@ -0,0 +1,69 @@
+import io
+from dataclasses import dataclass, field
+from typing import Dict, List, Sequence
+
+from PIL import Image
+
+
+@dataclass
+class ImageVariant:
+    """One encoded rendition of a source image."""
+    width: int
+    height: int
+    format: str
+    data: bytes
+
+    @property
+    def content_type(self) -> str:
+        return f"image/{self.format}"
+
+    @property
+    def extension(self) -> str:
+        return "jpg" if self.format == "jpeg" else self.format
+
+
+@dataclass
+class StoredImage:
+    """
+    Where a post's image lives: `url` is the JPEG fallback, `variants` the
+    responsive renditions ({"url", "width", "format"}) for a srcset.
+    """
+    url: str
+    variants: List[Dict] = field(default_factory=list)
+
+
+def render_variants(
+    image_bytes: bytes, widths: Sequence[int], webp_quality: int = 80, jpeg_quality: int = 85
+) -> List[ImageVariant]:
+    """
+    Decodes the image once and encodes a WebP rendition per width, plus a JPEG
+    fallback at the largest width. Widths above the source's are dropped;
+    images are never upscaled.
+    """
+    img = Image.open(io.BytesIO(image_bytes))
+    max_width = min(max(widths), img.width)
+    max_height = max(1, round(img.height * max_width / img.width))
+    # For JPEGs, let the decoder scale down by 1/2, 1/4 or 1/8 while decoding
+    # when the source is much larger than the biggest rendition.
+    img.draft("RGB", (max_width, max_height))
+    img = img.convert("RGB")
+
+    targets = sorted({w for w in widths if w < img.width} | {max_width}, reverse=True)
+    variants = []
+    # Each rendition is resized from the previous, larger one: cheaper than
+    # going back to the full decode every time, with no visible difference.
+    current = img
+    for width in targets:
+        height = max(1, round(current.height * width / current.width))
+        if current.width != width:
+            current = current.resize((width, height), Image.Resampling.LANCZOS)
+        variants.append(_encode(current, "webp", quality=webp_quality, method=4))
+        if width == max_width:
+            variants.append(_encode(current, "jpeg", quality=jpeg_quality, optimize=True, progressive=True))
+    return variants
+
+
+def _encode(img: Image.Image, fmt: str, **options) -> ImageVariant:
+    buffer = io.BytesIO()
+    img.save(buffer, fmt.upper(), **options)
+    return ImageVariant(width=img.width, height=img.height, format=fmt, data=buffer.getvalue())
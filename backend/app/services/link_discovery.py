@@ -0,0 +1,142 @@
+import heapq
+import re
+from typing import List, Optional, Tuple
+from urllib.parse import urljoin, urlsplit
+
+from lxml import etree
+
+from app.services.feeds import FeedItem, iter_feed_items
+
+# Pure parsing helpers for source discovery. They take and return plain
+# values only, so they can run in a worker process.
+
+PATH_BLACKLIST = {'/category/', '/tag/', '/author/', '/page/', '/search', '.pdf'}
+
+
+def parse_source_links(content: bytes, content_type: str, source_url: str, limit: int) -> List[FeedItem]:
+    """
+    Dispatches on the response content type and returns up to `limit`
+    article links. Links scraped from HTML carry no guid or date.
+    """
+    if "xml" in content_type or "rss" in content_type or "atom" in content_type:
+        return parse_feed_links(content, limit)
+    if "html" in content_type:
+        return [FeedItem(link=url) for url in parse_html_links(content, source_url, limit)]
+    return []
+
+
+def parse_feed_links(content: bytes, limit: int) -> List[FeedItem]:
+    """Returns the first `limit` items of an RSS or Atom feed."""
+    return list(iter_feed_items(content, limit))
+
+
+def parse_html_links(content: bytes, source_url: str, limit: int) -> List[str]:
+    """Returns same-site links from a homepage whose anchor text looks like a headline."""
+    return LinkExtractor(source_url).extract(content, limit)
+
+
+def score_link(path: str) -> int:
+    """
+    Rates how much a URL path looks like an article: dated paths, long
+    hyphenated slugs and numeric story ids each add to the score.
+    """
+    score = 0
+    if _DATE_SEGMENT.search(path):
+        score += 2
+    if _SLUG_SEGMENT.search(path):
+        score += 2
+    if _NUMERIC_ID.search(path):
+        score += 1
+    return score
+
+
+class LinkExtractor:
+    """
+    Pulls candidate article links out of a homepage. Only anchors are
+    collected (no document tree is built), the source origin and blacklist
+    are prepared once, and the best-scoring links win, ties keeping page
+    order.
+    """
+
+    def __init__(self, source_url: str, blacklist=PATH_BLACKLIST, min_words: int = 5):
+        self.source_url = source_url
+        parsed = urlsplit(source_url)
+        self.netloc = parsed.netloc
+        self.origin = f"{parsed.scheme}://{parsed.netloc}"
+        self.min_words = min_words
+        self._blacklisted = re.compile("|".join(re.escape(part) for part in blacklist)).search
+
+    def extract(self, content: bytes, limit: int) -> List[str]:
+        if limit <= 0 or not content.strip():
+            return []
+        candidates, seen = [], set()
+        for href, text in _read_anchors(content):
+            if href.startswith(_SKIPPED_HREFS) or len(text.split()) < self.min_words:
+                continue
+            resolved = self._resolve(href)
+            if resolved is None:
+                continue
+            full_url, path = resolved
+            if full_url in seen or full_url == self.source_url or self._blacklisted(path):
+                continue
+            seen.add(full_url)
+            candidates.append((-score_link(path), len(candidates), full_url))
+        return [url for _, _, url in heapq.nsmallest(limit, candidates)]
+
+    def _resolve(self, href: str) -> Optional[Tuple[str, str]]:
+        """
+        Returns (absolute URL, path) for a same-site http(s) link without a
+        fragment, else None. Root-relative and absolute hrefs, the bulk of a
+        homepage, are handled without a full urljoin.
+        """
+        if "#" in href:
+            return None
+        if href.startswith("/") and not href.startswith("//") and "/." not in href:
+            return self.origin + href, href.split("?", 1)[0]
+        if href.startswith(("http://", "https://")):
+            if href.split("/", 3)[2] != self.netloc:
+                return None
+            full_url = href
+        else:
+            full_url = urljoin(self.source_url, href)
+        parsed_url = urlsplit(full_url)
+        if parsed_url.scheme not in ('http', 'https') or parsed_url.netloc != self.netloc:
+            return None
+        return full_url, parsed_url.path
+
+
+_SKIPPED_HREFS = ("#", "javascript:", "mailto:", "tel:")
+_DATE_SEGMENT = re.compile(r"/(?:19|20)\d{2}[/-](?:0?[1-9]|1[0-2])(?:[/-]|$)")
+_SLUG_SEGMENT = re.compile(r"/[a-z0-9]+(?:-[a-z0-9]+){3,}(?:\.html?)?/?$", re.IGNORECASE)
+_NUMERIC_ID = re.compile(r"\d{5,}")
+
+
+class _AnchorCollector:
+    """lxml parser target that keeps only (href, text) of <a> elements."""
+
+    def __init__(self):
+        self.anchors: List[Tuple[str, str]] = []
+        self._href: Optional[str] = None
+        self._text: List[str] = []
+
+    def start(self, tag, attrib):
+        if tag == "a":
+            self._href = attrib.get("href")
+            self._text = []
+
+    def data(self, data):
+        if self._href is not None:
+            self._text.append(data)
+
+    def end(self, tag):
+        if tag == "a" and self._href is not None:
+            self.anchors.append((self._href.strip(), "".join(self._text)))
+            self._href = None
+
+    def close(self):
+        return self.anchors
+
+
+def _read_anchors(content: bytes) -> List[Tuple[str, str]]:
+    parser = etree.HTMLParser(target=_AnchorCollector(), no_network=True)
+    return etree.fromstring(content, parser)
@@ -1,31 +1,127 @@
 # filepath: backend/app/services/news_fetcher_service.py
 import asyncio
 import httpx
-from bs4 import BeautifulSoup
-import trafilatura
 import google.generativeai as genai
-from datetime import datetime
-from typing import List, Dict, Any, AsyncGenerator, Optional
-from urllib.parse import urljoin, urlparse
-from PIL import Image, ImageDraw, ImageFont
-import io
+from contextlib import suppress
+from dataclasses import dataclass, field
+from functools import partial
+from datetime import datetime, timedelta
+from typing import List, Dict, Any, AsyncGenerator, Optional, Tuple
+import hashlib
 import uuid
-import os
 import json
-import boto3
-from botocore.client import Config
+from urllib.parse import urljoin, urlparse
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from app.core.config import settings
-from app.models.user import Post, User
+from app.db.dialect import upsert_insert
+from app.db.session import AsyncSessionLocal
+from app.models.user import Post, PostFingerprint, User
 from app.models.news import NewsSource
 from app.schemas.post import FetchStatus
+from app.services.article_document import ArticleDocument, parse_article
+from app.services.host_scheduler import HostScheduler, ResponseTooLarge
+from app.services.http_transport import get_fetcher_client
+from app.services.image_registry import image_content_hash, find_image_by_url, find_image_by_hash, register_image
+from app.services.image_variants import StoredImage, render_variants
+from app.services.circuit_breaker import CircuitOpen, host_breakers, record_source_result, source_circuit_allows
+from app.services.feeds import FeedItem
+from app.services.fetch_metrics import RunMetrics, fetch_metrics, metrics_source
+from app.services.link_discovery import PATH_BLACKLIST, parse_source_links
+from app.services.object_uploader import object_uploader
+from app.services.pexels import pexels_search
+from app.services.placeholder_images import placeholder_renderer
+from app.services.near_duplicates import NearDuplicateIndex, fingerprint_row
+from app.services.parse_pool import run_parse
+from app.services.poll_schedule import update_poll_schedule
+from app.services.sitemaps import SitemapTooLarge, parse_robots_sitemaps, parse_sitemap
+from app.services.summary_cache import summary_cache_key, get_cached_summaries, store_summaries, evict_summaries
+from app.services.url_index import known_url_index, find_existing_urls
 
 # Configure Google Gemini API
 if settings.GOOGLE_API_KEY:
     genai.configure(api_key=settings.GOOGLE_API_KEY)
 
+AI_MODEL_NAME = 'gemini-1.5-flash'
+# Bump whenever the prompt or model changes so cached summaries are not reused.
+AI_PROMPT_VERSION = f"{AI_MODEL_NAME}:1"
+AI_FALLBACK_PREFIX = "AI Fallback: "
+# Characters of article text sent to the model, and rough token allowances
+# for the instructions wrapped around each article and for its answer
+# (headline, summary and multi-paragraph description).
+AI_TEXT_LIMIT = 8000
+AI_PROMPT_TOKENS = 200
+AI_OUTPUT_TOKENS = 800
+AI_TASKS = """1. Create a new, concise, and factual headline.
+2. Write a brief one-paragraph summary.
+3. Write a detailed, multi-paragraph description."""
+AI_GUIDELINES = """- The tone must be strictly neutral and informative.
+- Do NOT add any interpretation, opinion, or information not present in the text.
+- Base all output exclusively on the provided content."""
+
+_ai_model = None
+
+
+def _get_ai_model():
+    """Returns the process-wide Gemini model, created on first use."""
+    global _ai_model
+    if _ai_model is None:
+        _ai_model = genai.GenerativeModel(AI_MODEL_NAME)
+    return _ai_model
+
+
+def _is_site_root(url: str) -> bool:
+    """True for a site's homepage, as opposed to a section page or feed."""
+    parsed = urlparse(url)
+    return parsed.path in ("", "/") and not parsed.query
+
+
+# Sentinel pushed through a stage queue to stop its workers.
+_STOP = object()
+
+
+@dataclass
+class _ArticleJob:
+    """An article travelling through the ingestion pipeline."""
+    url: str
+    source: NewsSource
+    # The discovery entry (guid, feed date) the article came from.
+    feed_item: Optional[FeedItem] = None
+    content: bytes = b""
+    content_type: str = ""
+    doc: Optional[ArticleDocument] = None
+    ai_content: Dict[str, str] = field(default_factory=dict)
+    image: Optional[StoredImage] = None
+
+
+@dataclass
+class _PipelineState:
+    """Aggregate run counters; progress is derived from these."""
+    total_sources: int
+    sources_done: int = 0
+    articles_found: int = 0
+    articles_done: int = 0
+    saved: int = 0
+    skipped: int = 0
+    failed: int = 0
+    index_hits: int = 0
+    index_misses: int = 0
+    ai_cache_hits: int = 0
+    image_registry_hits: int = 0
+    saved_by_source: Dict[int, int] = field(default_factory=dict)
+    _last_progress: float = 5.0
+
+    def progress(self) -> float:
+        # Every source counts as one unit of discovery work and every
+        # discovered article as one more unit; progress never moves backwards.
+        total_units = self.total_sources + self.articles_found
+        done_units = self.sources_done + self.articles_done
+        current = 5 + 94 * (done_units / total_units) if total_units else 5
+        self._last_progress = max(self._last_progress, current)
+        return round(self._last_progress, 1)
+
+
 class NewsFetcherService:
     """
     An asynchronous service to fetch all latest articles from a persistent
@@ -37,284 +133,838 @@ class NewsFetcherService:
         self.superadmin = superadmin
         # --- NEW: Configurable limit for links per source ---
         self.max_links_per_source = 10
-        self.client = httpx.AsyncClient(timeout=20.0, follow_redirects=True, headers={
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        })
+        # Shared across runs, so the first requests reuse warm connections.
+        self.client = get_fetcher_client()
+        # All outbound GETs go through the scheduler so parallel workers stay
+        # polite towards each publisher host.
+        self.scheduler = HostScheduler(
+            self.client,
+            max_connections_per_host=settings.FETCHER_MAX_CONNECTIONS_PER_HOST,
+            min_host_delay=settings.FETCHER_MIN_HOST_DELAY_SECONDS,
+            max_in_flight=settings.FETCHER_MAX_IN_FLIGHT,
+            max_retry_after=settings.FETCHER_MAX_RETRY_AFTER_SECONDS,
+            byte_limits={
+                "text/html": settings.FETCHER_MAX_HTML_BYTES,
+                "application/xhtml": settings.FETCHER_MAX_HTML_BYTES,
+                "application/rss": settings.FETCHER_MAX_FEED_BYTES,
+                "application/atom": settings.FETCHER_MAX_FEED_BYTES,
+                "application/xml": settings.FETCHER_MAX_FEED_BYTES,
+                "text/xml": settings.FETCHER_MAX_FEED_BYTES,
+                "image/": settings.FETCHER_MAX_IMAGE_BYTES,
+            },
+            default_byte_limit=settings.FETCHER_MAX_RESPONSE_BYTES,
+            # Hosts that keep failing are skipped instead of timing out on every URL.
+            breakers=host_breakers,
+        )
         self.processed_urls = set()
-        
-        # Initialize R2 client if configured
-        self.r2_client = None
-        if all([settings.R2_ACCOUNT_ID, settings.R2_ACCESS_KEY_ID, settings.R2_SECRET_ACCESS_KEY]):
-            self.r2_client = boto3.client(
-                's3',
-                endpoint_url=f'https://{settings.R2_ACCOUNT_ID}.r2.cloudflarestorage.com',
-                aws_access_key_id=settings.R2_ACCESS_KEY_ID,
-                aws_secret_access_key=settings.R2_SECRET_ACCESS_KEY,
-                config=Config(signature_version='s3v4')
-            )
-            print("Cloudflare R2 client initialized.")
-        else:
-            print("Cloudflare R2 not configured. Images will be stored locally.")
 
-    async def run(self) -> AsyncGenerator[FetchStatus, None]:
+        # Pipeline sizing: each stage gets its own worker pool, connected by
+        # bounded queues so a slow stage applies back-pressure upstream.
+        self.queue_size = settings.FETCHER_QUEUE_SIZE
+        self.stage_workers = {
+            "discover": settings.FETCHER_DISCOVERY_WORKERS,
+            "fetch": settings.FETCHER_FETCH_WORKERS,
+            "extract": settings.FETCHER_EXTRACT_WORKERS,
+            # A single dedupe worker keeps the in-run near-duplicate index race-free.
+            "dedupe": 1,
+            "summarize": settings.FETCHER_SUMMARIZE_WORKERS,
+            "image": settings.FETCHER_IMAGE_WORKERS,
+            # A single persist worker so posts accumulate into full batches.
+            "persist": 1,
+        }
+        self._db_lock = asyncio.Lock()
+        # Source id -> cache validators and discovery time from this run,
+        # stored on the source only once its links have been queued.
+        self._discovery_updates: Dict[int, Dict[str, Any]] = {}
+
+        # Batched summarization: up to `ai_batch_size` articles share one
+        # Gemini request (1 disables batching).
+        self.ai_batch_size = settings.FETCHER_AI_BATCH_SIZE
+        self.ai_batch_token_budget = settings.FETCHER_AI_BATCH_TOKEN_BUDGET
+        self.ai_batch_wait = settings.FETCHER_AI_BATCH_WAIT_SECONDS
+        self._ai_in_flight: Dict[str, asyncio.Future] = {}
+
+        # Posts are written in batches, flushed when full or after the interval.
+        self.persist_batch_size = settings.FETCHER_PERSIST_BATCH_SIZE
+        self.persist_flush_interval = settings.FETCHER_PERSIST_FLUSH_SECONDS
+        self.near_duplicates = NearDuplicateIndex(settings.FETCHER_NEAR_DUPLICATE_MAX_DISTANCE)
+
+        # Image URL or content hash -> task storing it, so a shared image is
+        # handled once per run.
+        self._image_tasks: Dict[str, asyncio.Future] = {}
+        self.image_widths = settings.FETCHER_IMAGE_WIDTHS
+
+        # Per-stage timings for this run, also fed to the process-wide histograms.
+        self.metrics = RunMetrics(fetch_metrics)
+
+    async def run(self, source_ids: Optional[List[int]] = None) -> AsyncGenerator[FetchStatus, None]:
+        """Fetches all saved sources, or only those in `source_ids`."""
         yield FetchStatus(stage="Initializing", progress=0, message="Fetching saved news sources...")
         
-        sources_result = await self.db.execute(select(NewsSource))
+        stmt = select(NewsSource)
+        if source_ids is not None:
+            stmt = stmt.where(NewsSource.id.in_(source_ids))
+        sources_result = await self.db.execute(stmt)
         sources = sources_result.scalars().all()
         
         if not sources:
             yield FetchStatus(stage="Complete", progress=100, message="No news sources configured. Add sources to begin.", is_complete=True)
             return
 
-        yield FetchStatus(stage="Initializing", progress=5, message=f"Found {len(sources)} sources. Starting fetch loop.")
-        total_sources = len(sources)
-        progress_per_source = 95 / total_sources
+        yield FetchStatus(stage="Initializing", progress=5, message=f"Found {len(sources)} sources. Starting ingestion pipeline.")
+
+        # The pipeline runs as a background task and reports through an event
+        # queue; this generator only relays those events to the caller.
+        self._state = _PipelineState(total_sources=len(sources))
+        # Sitemap entries modified after this are new to the next run.
+        self._run_started_at = datetime.utcnow()
+        # The upload pool is shared across jobs; its counters are diffed per run.
+        uploads_before = object_uploader.stats()
+        await known_url_index.warm(self.db)
+        self._events = asyncio.Queue()
+        pipeline = asyncio.create_task(self._run_pipeline(sources))
+        try:
+            while True:
+                event = await self._events.get()
+                if event is None:
+                    break
+                yield event
+            await pipeline
+        finally:
+            # Stop all stage workers if the consumer goes away mid-run.
+            if not pipeline.done():
+                pipeline.cancel()
+                with suppress(asyncio.CancelledError):
+                    await pipeline
+
+        state = self._state
+        uploads = object_uploader.stats()
+        stage_timings = self.metrics.summary()
+        slowest = sorted(stage_timings.items(), key=lambda item: item[1].total_seconds, reverse=True)[:3]
+        yield FetchStatus(
+            stage="Complete", progress=100, is_complete=True, metrics=stage_timings,
+            message=(
+                f"News fetch loop finished. Saved {state.saved} new posts, skipped {state.skipped}, {state.failed} failed. "
+                f"URL index: {state.index_hits} hits, {state.index_misses} misses. "
+                f"AI summary cache: {state.ai_cache_hits} hits. "
+                f"Image registry: {state.image_registry_hits} hits. "
+                f"Uploads: {uploads.completed - uploads_before.completed} done, "
+                f"{uploads.failed - uploads_before.failed} fell back to local storage, p95 {uploads.p95_ms:.0f} ms. "
+                f"Slowest stages: " + (", ".join(
+                    f"{stage} {timing.total_seconds:.1f}s (p95 {timing.p95_ms:.0f} ms)" for stage, timing in slowest
+                ) or "none") + "."
+            )
+        )
+
+    # --- PIPELINE PLUMBING ---
+
+    async def _run_pipeline(self, sources: List[NewsSource]):
+        """Wires the stages together with bounded queues and waits for them to drain."""
+        source_queue: asyncio.Queue = asyncio.Queue()
+        for source in sources:
+            source_queue.put_nowait(source)
+
+        summarize = (self._summarize_stage, self._stage_worker)
+        if self.ai_batch_size > 1:
+            summarize = (self._summarize_batch_stage, partial(
+                self._batch_stage_worker, max_items=self.ai_batch_size, max_wait=self.ai_batch_wait,
+                cost=self._estimate_ai_tokens, budget=self.ai_batch_token_budget,
+            ))
+        persist = (self._persist_batch_stage, partial(
+            self._batch_stage_worker, max_items=self.persist_batch_size, max_wait=self.persist_flush_interval,
+        ))
+        stages = [
+            ("discover", (self._discover_stage, self._stage_worker)),
+            ("fetch", (self._fetch_stage, self._stage_worker)),
+            ("extract", (self._extract_stage, self._stage_worker)),
+            ("dedupe", (self._dedupe_stage, self._stage_worker)),
+            ("summarize", summarize),
+            ("image", (self._image_stage, self._stage_worker)),
+            ("persist", persist),
+        ]
+        inboxes = [source_queue] + [asyncio.Queue(maxsize=self.queue_size) for _ in stages[1:]]
+        for _ in range(self.stage_workers["discover"]):
+            source_queue.put_nowait(_STOP)
+
+        try:
+            await asyncio.gather(*(
+                self._run_stage(
+                    name, handler, worker, inboxes[i],
+                    inboxes[i + 1] if i + 1 < len(stages) else None,
+                    stages[i + 1][0] if i + 1 < len(stages) else None,
+                )
+                for i, (name, (handler, worker)) in enumerate(stages)
+            ))
+            # Persist source bookkeeping (feed validators, poll schedule) and
+            # cache maintenance even when no new post triggered a commit.
+            async with self._db_lock:
+                now = datetime.utcnow()
+                for source in sources:
+                    update_poll_schedule(source, self._state.saved_by_source.get(source.id, 0), now)
+                await evict_summaries(
+                    self.db, settings.FETCHER_AI_CACHE_MAX_ENTRIES, settings.FETCHER_AI_CACHE_MAX_AGE_DAYS
+                )
+                await self.db.commit()
+        finally:
+            self._events.put_nowait(None)
+
+    async def _run_stage(self, name: str, handler, worker, inbox: asyncio.Queue,
+                         outbox: Optional[asyncio.Queue], next_stage: Optional[str]):
+        """Runs the workers of one stage, then tells every downstream worker to stop."""
+        await asyncio.gather(*(
+            worker(handler, inbox, outbox) for _ in range(self.stage_workers[name])
+        ))
+        if outbox is not None:
+            for _ in range(self.stage_workers[next_stage]):
+                await outbox.put(_STOP)
 
-        # --- REFACTORED MAIN LOOP ---
-        for i, source in enumerate(sources):
-            current_source_progress_base = 5 + (i * progress_per_source)
-            yield FetchStatus(stage="Discovery", progress=current_source_progress_base, message=f"({i+1}/{total_sources}) Discovering articles from: {source.name}")
-            
+    async def _stage_worker(self, handler, inbox: asyncio.Queue, outbox: Optional[asyncio.Queue]):
+        while True:
+            item = await inbox.get()
+            if item is _STOP:
+                return
+            metrics_source.set(item.source.name if isinstance(item, _ArticleJob) else item.name)
             try:
-                article_urls = await self._discover_all_links(source)
-                if not article_urls:
-                    yield FetchStatus(stage="Discovery", progress=current_source_progress_base + progress_per_source, message=f"No new links found for {source.name}.")
-                    continue
-
-                yield FetchStatus(stage="Processing", progress=current_source_progress_base, message=f"Found {len(article_urls)} potential articles for {source.name}. Processing...")
-                
-                total_articles_in_source = len(article_urls)
-                
-                # --- NEW: Nested loop to process all articles from one source ---
-                for j, url in enumerate(article_urls):
-                    # Calculate fine-grained progress within the source's progress slice
-                    article_progress_contribution = ((j + 1) / total_articles_in_source) * progress_per_source
-                    total_progress = current_source_progress_base + article_progress_contribution
-                    
-                    if url in self.processed_urls or await self._is_duplicate(url):
-                        yield FetchStatus(stage="Skipping", progress=total_progress, message=f"({j+1}/{total_articles_in_source}) Skipping duplicate: {url.split('/')[-1]}")
-                        continue
-                    
-                    self.processed_urls.add(url)
-                    
-                    yield FetchStatus(
-                        stage="Processing", 
-                        progress=total_progress, 
-                        message=f"({j+1}/{total_articles_in_source}) Processing article from {source.name}..."
-                    )
-                    
-                    await self._process_article(url, source)
+                await handler(item, outbox)
+            except Exception as e:
+                if isinstance(item, _ArticleJob):
+                    self._finish_article("failed")
+                    self._emit("Error", f"Failed to process article from {item.source.name}: {str(e)}")
+                else:
+                    self._emit("Error", f"Failed to process {item.name}: {str(e)}")
 
+    async def _batch_stage_worker(self, handler, inbox: asyncio.Queue, outbox: Optional[asyncio.Queue], *,
+                                  max_items: int, max_wait: float, cost=None, budget: Optional[int] = None):
+        """
+        Like _stage_worker, but hands the handler a batch of jobs. A batch is
+        closed when it holds `max_items` jobs, when adding a job would push the
+        summed `cost(job)` over `budget`, or `max_wait` seconds after it was opened.
+        """
+        loop = asyncio.get_running_loop()
+        carry = None
+        stopping = False
+        while not stopping:
+            item = carry if carry is not None else await inbox.get()
+            carry = None
+            if item is _STOP:
+                return
+            batch, total_cost = [item], cost(item) if cost else 0
+            deadline = loop.time() + max_wait
+            while len(batch) < max_items:
+                try:
+                    item = await asyncio.wait_for(inbox.get(), max(0.0, deadline - loop.time()))
+                except asyncio.TimeoutError:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                item_cost = cost(item) if cost else 0
+                if budget is not None and total_cost + item_cost > budget:
+                    carry = item
+                    break
+                batch.append(item)
+                total_cost += item_cost
+            try:
+                await handler(batch, outbox)
             except Exception as e:
-                yield FetchStatus(stage="Error", progress=current_source_progress_base + progress_per_source, message=f"Failed to process {source.name}: {str(e)}")
+                for job in batch:
+                    self._finish_article("failed")
+                    self._emit("Error", f"Failed to process article from {job.source.name}: {str(e)}")
 
-        yield FetchStatus(stage="Complete", progress=100, message="News fetch loop finished.", is_complete=True)
+    @staticmethod
+    def _estimate_ai_tokens(job: _ArticleJob) -> int:
+        # Rough rule of thumb: ~4 characters per token for English prose.
+        input_tokens = (len(job.doc.display_title) + min(len(job.doc.content_text), AI_TEXT_LIMIT)) // 4
+        return input_tokens + AI_PROMPT_TOKENS + AI_OUTPUT_TOKENS
 
-    # --- NEW: Extracted logic for processing a single article ---
-    async def _process_article(self, url: str, source: NewsSource):
-        """Fetches, processes, and saves a single article."""
-        response = await self.client.get(url)
-        response.raise_for_status()
+    def _emit(self, stage: str, message: str):
+        self._events.put_nowait(FetchStatus(stage=stage, progress=self._state.progress(), message=message))
+
+    def _finish_article(self, outcome: str):
+        """Records that an article has left the pipeline ('saved', 'skipped' or 'failed')."""
+        self._state.articles_done += 1
+        setattr(self._state, outcome, getattr(self._state, outcome) + 1)
+
+    # --- PIPELINE STAGES ---
+
+    async def _discover_stage(self, source: NewsSource, outbox: asyncio.Queue):
+        """Finds candidate links for a source and queues the ones not seen before."""
+        self._emit("Discovery", f"Discovering articles from: {source.name}")
+        new_urls, feed_items = [], {}
+        try:
+            if not source_circuit_allows(source):
+                self.metrics.observe("discovery", source.name, "circuit_open", 0.0)
+                self._emit("Discovery", f"Skipping {source.name}: it keeps failing, next try after {source.circuit_open_until:%H:%M} UTC.")
+                return
+            items = await self._discover_all_links(source)
+            if items is None:
+                await self._save_discovery_updates(source)
+                self._emit("Discovery", f"{source.name} has not changed since the last run. Skipping.")
+                return
+            for item in items:
+                feed_items.setdefault(item.link, item)
+            # Claim URLs up front so parallel discovery workers never queue
+            # the same article twice.
+            candidates = [url for url in feed_items if url not in self.processed_urls]
+            self.processed_urls.update(candidates)
+            new_urls = await self._filter_duplicates(candidates)
+            for url in candidates:
+                if url not in new_urls:
+                    self._state.skipped += 1
+                    self._emit("Skipping", f"Skipping duplicate: {url.split('/')[-1]}")
+        finally:
+            self._state.sources_done += 1
+            self._state.articles_found += len(new_urls)
 
-        content_text = trafilatura.extract(response.text, include_comments=False, include_tables=False)
-        if not content_text or len(content_text) < 250:
-            # Silently skip short/empty articles to not clutter logs
+        if not new_urls:
+            await self._save_discovery_updates(source)
+            self._emit("Discovery", f"No new links found for {source.name}.")
             return
 
-        original_title = self._get_title(response.text) or "Untitled"
-        ai_content = await self._get_ai_content(original_title, content_text)
+        self._emit("Processing", f"Found {len(new_urls)} new articles for {source.name}. Processing...")
+        for url in new_urls:
+            await outbox.put(_ArticleJob(url=url, source=source, feed_item=feed_items[url]))
+        await self._save_discovery_updates(source)
+
+    async def _fetch_stage(self, job: _ArticleJob, outbox: asyncio.Queue):
+        with self.metrics.time("fetch"):
+            response = await self.scheduler.get(job.url)
+            response.raise_for_status()
+        # The body stays as bytes: decoding happens in the parse worker.
+        job.content = response.content
+        job.content_type = response.headers.get("content-type", "")
+        await outbox.put(job)
 
-        image_url = await self._handle_image(response.text, ai_content['title'], url)
+    async def _extract_stage(self, job: _ArticleJob, outbox: asyncio.Queue):
+        # One parse per article; later stages only see the compact document.
+        with self.metrics.time("extract") as timing:
+            job.doc = await run_parse(parse_article, job.content, job.content_type, job.url)
+            job.content = b""
+            if not job.doc.content_text or len(job.doc.content_text) < 250:
+                # Silently skip short/empty articles to not clutter logs
+                timing.outcome = "too_short"
+                self._finish_article("skipped")
+                return
+        await outbox.put(job)
 
-        new_post = Post(
-            title=ai_content['title'], summary=ai_content['summary'], description=ai_content['description'],
-            image_url=image_url, source_name=source.name, source_url=url,
-            published_date=datetime.utcnow(), author_id=self.superadmin.id
-        )
-        self.db.add(new_post)
-        await self.db.commit()
+    async def _dedupe_stage(self, job: _ArticleJob, outbox: asyncio.Queue):
+        """Drops syndicated copies of a story before any AI or image work is spent on them."""
+        fingerprint = job.doc.simhash
+        duplicate_of = self.near_duplicates.find_in_run(fingerprint)
+        if duplicate_of is None:
+            async with self._db_lock:
+                post_id = await self.near_duplicates.find_post(self.db, fingerprint)
+            if post_id is not None:
+                duplicate_of = f"post #{post_id}"
+        if duplicate_of is not None:
+            self._finish_article("skipped")
+            self._emit("Skipping", f"Skipping near-duplicate of {duplicate_of}: {job.url.split('/')[-1]}")
+            return
+        self.near_duplicates.add_to_run(fingerprint, job.url)
+        await outbox.put(job)
+
+    async def _summarize_stage(self, job: _ArticleJob, outbox: asyncio.Queue):
+        self._emit("Processing", f"Summarizing article from {job.source.name}...")
+        await self._summarize_jobs([job])
+        await outbox.put(job)
+
+    async def _summarize_batch_stage(self, jobs: List[_ArticleJob], outbox: asyncio.Queue):
+        self._emit("Processing", f"Summarizing {len(jobs)} articles in one request...")
+        await self._summarize_jobs(jobs)
+        for job in jobs:
+            await outbox.put(job)
+
+    async def _summarize_jobs(self, jobs: List[_ArticleJob]):
+        """
+        Fills in ai_content for each job, answering from the summary cache
+        where possible. Every job is timed for the whole call, since the
+        articles of a batch wait on the same request.
+        """
+        with self.metrics.time_batch("ai", [job.source.name for job in jobs]) as timings:
+            outcomes = await self._fill_ai_content(jobs)
+            for timing, outcome in zip(timings, outcomes):
+                timing.outcome = outcome
+
+    async def _fill_ai_content(self, jobs: List[_ArticleJob]) -> List[str]:
+        """Returns each job's outcome: "ok", "cache_hit" or "fallback"."""
+        keys = [summary_cache_key(job.doc.content_text, AI_PROMPT_VERSION) for job in jobs]
+        async with self._db_lock:
+            cached = await get_cached_summaries(self.db, keys)
+        self._state.ai_cache_hits += sum(1 for key in keys if key in cached)
+
+        # Identical texts in flight elsewhere in this run are awaited rather
+        # than sent to the model a second time.
+        misses, waiting = {}, {}
+        for job, key in zip(jobs, keys):
+            if key in cached or key in misses:
+                continue
+            if key in self._ai_in_flight:
+                waiting[key] = self._ai_in_flight[key]
+            else:
+                misses[key] = job
+                self._ai_in_flight[key] = asyncio.get_running_loop().create_future()
+
+        if misses:
+            try:
+                articles = [(job.doc.display_title or "Untitled", job.doc.content_text) for job in misses.values()]
+                if len(articles) > 1:
+                    results = await self._get_ai_content_batch(articles)
+                else:
+                    results = [await self._get_ai_content(*articles[0])]
+                fresh = dict(zip(misses.keys(), results))
+                # Only genuine model output is cached, never local fallbacks.
+                if settings.GOOGLE_API_KEY:
+                    async with self._db_lock:
+                        await store_summaries(self.db, {
+                            key: content for key, content in fresh.items()
+                            if not content["title"].startswith(AI_FALLBACK_PREFIX)
+                        })
+            except BaseException as e:
+                for key in misses:
+                    future = self._ai_in_flight.pop(key)
+                    if isinstance(e, Exception):
+                        future.set_exception(e)
+                        future.exception()  # mark retrieved: there may be no waiters
+                    else:
+                        future.cancel()
+                raise
+            for key, content in fresh.items():
+                self._ai_in_flight.pop(key).set_result(content)
+            cached.update(fresh)
+
+        for key, future in waiting.items():
+            cached[key] = await future
+            self._state.ai_cache_hits += 1
+
+        outcomes = []
+        for job, key in zip(jobs, keys):
+            job.ai_content = dict(cached[key])
+            if key not in misses:
+                outcomes.append("cache_hit")
+            elif job.ai_content["title"].startswith(AI_FALLBACK_PREFIX):
+                outcomes.append("fallback")
+            else:
+                outcomes.append("ok")
+        return outcomes
+
+    async def _image_stage(self, job: _ArticleJob, outbox: asyncio.Queue):
+        with self.metrics.time("image"):
+            job.image = await self._handle_image(job.doc.og_image, job.ai_content['title'])
+        await outbox.put(job)
+
+    async def _persist_batch_stage(self, jobs: List[_ArticleJob], outbox: None):
+        with self.metrics.time_batch("persist", [job.source.name for job in jobs]) as timings:
+            inserted = await self._insert_posts(jobs)
+            for job, timing in zip(jobs, timings):
+                if job.url not in inserted:
+                    timing.outcome = "duplicate"
+        for job in jobs:
+            known_url_index.add(job.url)
+            if job.url in inserted:
+                self._finish_article("saved")
+                saved_by_source = self._state.saved_by_source
+                saved_by_source[job.source.id] = saved_by_source.get(job.source.id, 0) + 1
+                self._emit("Saved", f"Saved \"{job.ai_content['title']}\" from {job.source.name}.")
+            else:
+                self._finish_article("skipped")
+                self._emit("Skipping", f"Skipping duplicate saved by another run: {job.url.split('/')[-1]}")
+
+    async def _insert_posts(self, jobs: List[_ArticleJob]) -> Dict[str, int]:
+        """
+        Writes a batch of posts in one statement. URLs that already exist (for
+        example, saved by a concurrent run) are left alone. Returns the
+        source_url -> id map of the rows actually inserted.
+        """
+        now = datetime.utcnow()
+        rows = [
+            {
+                "title": job.ai_content['title'], "summary": job.ai_content['summary'],
+                "description": job.ai_content['description'], "image_url": job.image.url,
+                "image_variants": job.image.variants,
+                "source_name": job.source.name, "source_url": job.url,
+                # A date in the future would pin the post to the top of the list.
+                "published_date": min(self._published_date(job) or now, now), "created_at": now,
+                "is_ai_generated": True, "author_id": self.superadmin.id,
+            }
+            for job in jobs
+        ]
+        fingerprints = {job.url: job.doc.simhash for job in jobs}
+
+        # The main session's pending writes (source state, summary cache,
+        # image registry) are committed first: its transaction never spans
+        # the whole run, and the rows these posts rely on land before them.
+        # It stays idle until the batch is in, as SQLite has a single writer.
+        # The posts get a short-lived session of their own: a failed flush
+        # must not roll back (and expire) the objects the rest of the
+        # pipeline is working with.
+        async with self._db_lock:
+            await self.db.commit()
+            async with AsyncSessionLocal() as session:
+                result = await session.execute(
+                    upsert_insert(session, Post).values(rows)
+                    .on_conflict_do_nothing(index_elements=["source_url"])
+                    .returning(Post.id, Post.source_url)
+                )
+                inserted = {source_url: post_id for post_id, source_url in result.all()}
+                if inserted:
+                    await session.execute(
+                        upsert_insert(session, PostFingerprint).values([
+                            fingerprint_row(post_id, fingerprints[url]) for url, post_id in inserted.items()
+                        ]).on_conflict_do_nothing(index_elements=["post_id"])
+                    )
+                await session.commit()
+        return inserted
+
+    @staticmethod
+    def _published_date(job: _ArticleJob) -> Optional[datetime]:
+        """The article's own date, else the one its feed gave."""
+        if job.doc.published_date:
+            return job.doc.published_date
+        return job.feed_item.published if job.feed_item else None
 
     # --- MODIFIED: Renamed and updated to find multiple links ---
-    async def _discover_all_links(self, source: NewsSource) -> List[str]:
-        """For a given source, find all recent article links up to a limit."""
-        links = []
+    async def _discover_all_links(self, source: NewsSource) -> Optional[List[FeedItem]]:
+        """
+        For a given source, find all recent article links up to a limit.
+        Returns None when the source has not changed since the last run.
+        Sources pointing at a site's homepage are read through the site's
+        sitemap when robots.txt advertises one.
+        """
+        with self.metrics.time("discovery", source.name) as timing:
+            started = asyncio.get_running_loop().time()
+            try:
+                links = await self._discover_source_links(source)
+            except CircuitOpen as e:
+                # The host is already known to be failing; not held against the source.
+                print(f"Could not discover links from {source.url}: {e}")
+                timing.outcome = "circuit_open"
+                return []
+            except Exception as e:
+                print(f"Could not discover links from {source.url}: {e}")
+                timing.outcome = "error"
+                # The feed was not read, so the next run must not see it as unchanged.
+                self._discovery_updates.pop(source.id, None)
+                async with self._db_lock:
+                    record_source_result(source, ok=False)
+                return []
+            async with self._db_lock:
+                record_source_result(source, ok=True, latency=asyncio.get_running_loop().time() - started)
+            timing.outcome = "unchanged" if links is None else "ok"
+            return links
+
+    async def _discover_source_links(self, source: NewsSource) -> Optional[List[FeedItem]]:
+        if _is_site_root(source.url) and self._sitemap_lookup_due(source):
+            await self._find_sitemap(source)
+        if source.sitemap_url:
+            return await self._discover_sitemap_links(source)
+
+        response = await self.scheduler.get(source.url, headers=self._conditional_headers(source))
+        if response.status_code == 304:
+            return None
+        response.raise_for_status()
+        if not self._stage_validators(source, response):
+            return None
+        content_type = response.headers.get("content-type", "").lower()
+        return await run_parse(
+            parse_source_links, response.content, content_type, source.url, self.max_links_per_source
+        )
+
+    def _sitemap_lookup_due(self, source: NewsSource) -> bool:
+        """A site without a sitemap is looked up again after FETCHER_SITEMAP_RECHECK_SECONDS."""
+        if source.sitemap_url is None:
+            return True
+        if source.sitemap_url:
+            return False
+        recheck_after = timedelta(seconds=settings.FETCHER_SITEMAP_RECHECK_SECONDS)
+        return source.sitemap_checked_at is None or source.sitemap_checked_at + recheck_after <= self._run_started_at
+
+    async def _find_sitemap(self, source: NewsSource):
+        """Looks up the site's sitemap in robots.txt and remembers it ("" when there is none)."""
         try:
-            response = await self.client.get(source.url)
-            response.raise_for_status()
-            content_type = response.headers.get("content-type", "").lower()
-            
-            # Case 1: XML Feed (RSS/Atom)
-            if "xml" in content_type or "rss" in content_type:
-                soup = BeautifulSoup(response.content, "lxml-xml")
-                # Find all items and limit them
-                items = soup.find_all("item", limit=self.max_links_per_source)
-                for item in items:
-                    if item.find("link"):
-                        links.append(item.find("link").text.strip())
-                return links
-            
-            # Case 2: Standard HTML Page
-            elif "html" in content_type:
-                soup = BeautifulSoup(response.content, "lxml")
-                path_blacklist = {'/category/', '/tag/', '/author/', '/page/', '/search', '.pdf'}
-                for a_tag in soup.find_all("a", href=True):
-                    if len(links) >= self.max_links_per_source:
-                        break # Stop once we've hit our limit
-                    
-                    href = a_tag.get('href')
-                    if not href: continue
-                    
-                    full_url = urljoin(source.url, href)
-                    parsed_url = urlparse(full_url)
-                    
-                    if (parsed_url.scheme not in ('http', 'https') or
-                        parsed_url.netloc != urlparse(source.url).netloc or
-                        parsed_url.fragment or
-                        full_url == source.url or
-                        any(blacklisted in parsed_url.path for blacklisted in path_blacklist) or
-                        len(a_tag.get_text(strip=True).split()) < 5):
-                        continue
-                    
-                    if full_url not in links:
-                        links.append(full_url)
-                return links
+            response = await self.scheduler.get(urljoin(source.url, "/robots.txt"))
+        except (httpx.HTTPError, ResponseTooLarge) as e:
+            print(f"Could not read robots.txt for {source.url}: {e}")
+            return
+        if response.status_code >= 500:
+            # Try again next run rather than concluding there is no sitemap.
+            return
+        sitemaps = parse_robots_sitemaps(response.text) if response.is_success else []
+        sitemap_url = sitemaps[0] if sitemaps else ""
+        async with self._db_lock:
+            if sitemap_url != source.sitemap_url:
+                # The stored validators belong to whatever was read before.
+                source.etag = source.last_modified = source.content_hash = None
+            source.sitemap_url = sitemap_url
+            source.sitemap_checked_at = self._run_started_at
 
-        except Exception as e:
-            print(f"Could not discover links from {source.url}: {e}")
+    async def _discover_sitemap_links(self, source: NewsSource) -> Optional[List[FeedItem]]:
+        """
+        Streams the source's sitemap (and, for a sitemap index, its newest
+        children) keeping only entries modified since discovery last succeeded.
+        Cache validators are only kept for a plain sitemap: an index can stay
+        the same while its children change, so it is always walked.
+        """
+        response = await self.scheduler.get(
+            source.sitemap_url, headers=self._conditional_headers(source),
+            max_bytes=settings.FETCHER_MAX_FEED_BYTES,
+        )
+        if response.status_code in (404, 410):
+            # The sitemap moved; look it up again next run.
+            async with self._db_lock:
+                source.sitemap_url = None
+        if response.status_code == 304:
+            links = None
+        else:
+            response.raise_for_status()
+            # Only a plain sitemap ever has a stored hash, so a match means it is unchanged.
+            if hashlib.sha256(response.content).hexdigest() == source.content_hash:
+                links, complete = None, True
+            else:
+                urls, complete = await self._parse_sitemap_links(source, response)
+                links = [FeedItem(link=url) for url in urls]
+        if complete:
+            # A child sitemap that could not be read keeps the old watermark,
+            # so its entries are still new to the next run.
+            self._discovery_updates.setdefault(source.id, {})["last_discovered_at"] = self._run_started_at
         return links
 
-    async def _is_duplicate(self, url: str) -> bool:
-        result = await self.db.execute(select(Post).where(Post.source_url == url))
-        return result.scalar_one_or_none() is not None
+    async def _parse_sitemap_links(self, source: NewsSource, response: httpx.Response) -> Tuple[List[str], bool]:
+        """Returns the sitemap's new URLs, and whether every child sitemap could be read."""
+        since, limit = source.last_discovered_at, self.max_links_per_source
+        max_bytes = settings.FETCHER_MAX_FEED_BYTES
+        sitemap = await run_parse(
+            parse_sitemap, response.content, source.url, since, limit, max_bytes, PATH_BLACKLIST
+        )
+        if not sitemap.sitemaps:
+            self._stage_validators(source, response)
+            return sitemap.urls, True
+        self._discovery_updates[source.id] = {"etag": None, "last_modified": None, "content_hash": None}
+        urls = sitemap.urls
+
+        async def read_child(child_url: str) -> Optional[List[str]]:
+            try:
+                response = await self.scheduler.get(child_url, max_bytes=max_bytes)
+                response.raise_for_status()
+                child = await run_parse(
+                    parse_sitemap, response.content, source.url, since, limit, max_bytes, PATH_BLACKLIST
+                )
+            except (httpx.HTTPError, ResponseTooLarge, SitemapTooLarge) as e:
+                print(f"Could not read sitemap {child_url}: {e}")
+                return None
+            return child.urls
+
+        children = sitemap.sitemaps[:settings.FETCHER_SITEMAP_MAX_CHILDREN]
+        complete = True
+        for child_urls in await asyncio.gather(*(read_child(url) for url in children)):
+            if child_urls is None:
+                complete = False
+            else:
+                urls.extend(child_urls)
+        return list(dict.fromkeys(urls))[:limit], complete
+
+    def _conditional_headers(self, source: NewsSource) -> Dict[str, str]:
+        headers = {}
+        if source.etag:
+            headers["If-None-Match"] = source.etag
+        if source.last_modified:
+            headers["If-Modified-Since"] = source.last_modified
+        return headers
 
-    def _get_title(self, html: str) -> str:
-        soup = BeautifulSoup(html, "lxml")
-        if soup.title and soup.title.string:
-            return soup.title.string
-        og_title = soup.find("meta", property="og:title")
-        if og_title and og_title.get("content"):
-            return og_title["content"]
-        return ""
+    def _stage_validators(self, source: NewsSource, response: httpx.Response) -> bool:
+        """
+        Holds the feed's new cache validators until its links are queued (see
+        _save_discovery_updates). Returns False when the body is byte-for-byte
+        identical to the previous run's.
+        """
+        content_hash = hashlib.sha256(response.content).hexdigest()
+        if content_hash == source.content_hash:
+            return False
+        self._discovery_updates[source.id] = {
+            "etag": response.headers.get("etag"),
+            "last_modified": response.headers.get("last-modified"),
+            "content_hash": content_hash,
+        }
+        return True
+
+    async def _save_discovery_updates(self, source: NewsSource):
+        updates = self._discovery_updates.pop(source.id, {})
+        # Taken under the DB lock so the change cannot race a concurrent flush.
+        async with self._db_lock:
+            for name, value in updates.items():
+                setattr(source, name, value)
+
+    async def _filter_duplicates(self, urls: List[str]) -> List[str]:
+        """
+        Returns the URLs that are not yet posts. The in-memory index answers
+        known URLs; the rest are checked together in a single query.
+        """
+        unknown = []
+        for url in urls:
+            if url in known_url_index:
+                self._state.index_hits += 1
+            else:
+                self._state.index_misses += 1
+                unknown.append(url)
+        async with self._db_lock:
+            existing = await find_existing_urls(self.db, unknown)
+        known_url_index.add_many(existing)
+        return [url for url in unknown if url not in existing]
 
     async def _get_ai_content(self, title: str, text: str) -> Dict[str, str]:
         if not settings.GOOGLE_API_KEY:
             return {"title": f"Summary of: {title}", "summary": text[:200] + "...", "description": text[:1000] + "..."}
-        model = genai.GenerativeModel('gemini-1.5-flash')
         prompt = f"""Based *only* on the following article text, please perform these three tasks:
-1. Create a new, concise, and factual headline.
-2. Write a brief one-paragraph summary.
-3. Write a detailed, multi-paragraph description.
+{AI_TASKS}
 Guidelines:
-- The tone must be strictly neutral and informative.
-- Do NOT add any interpretation, opinion, or information not present in the text.
-- Base all output exclusively on the provided content.
+{AI_GUIDELINES}
 - Format the output as a JSON object with three keys: "title", "summary", and "description".
 Original Title: "{title}"
-Article Text: --- {text[:8000]} ---"""
+Article Text: --- {text[:AI_TEXT_LIMIT]} ---"""
         try:
-            response = await model.generate_content_async(prompt)
+            response = await _get_ai_model().generate_content_async(prompt)
             json_text = response.text.strip().lstrip("```json").rstrip("```")
             return json.loads(json_text)
         except Exception as e:
-            return {"title": f"AI Fallback: {title}", "summary": f"AI processing failed: {e}. " + text[:150] + "...", "description": text}
+            return {"title": f"{AI_FALLBACK_PREFIX}{title}", "summary": f"AI processing failed: {e}. " + text[:150] + "...", "description": text}
+
+    async def _get_ai_content_batch(self, articles: List[Tuple[str, str]]) -> List[Dict[str, str]]:
+        """
+        Summarizes several (title, text) pairs with a single Gemini request.
+        Articles malformed in the batched answer fall back to individual
+        _get_ai_content calls, and so do all of them when the answer's ids
+        are not exactly 0..n-1, as its summaries cannot then be trusted to
+        belong to the right article.
+        """
+        if not settings.GOOGLE_API_KEY or len(articles) == 1:
+            return [await self._get_ai_content(title, text) for title, text in articles]
+
+        article_blocks = "\n".join(
+            f'[Article {i}]\nOriginal Title: "{title}"\nArticle Text: --- {text[:AI_TEXT_LIMIT]} ---'
+            for i, (title, text) in enumerate(articles)
+        )
+        prompt = f"""Below are {len(articles)} unrelated articles. For each article independently, and based *only* on that article's text, please perform these three tasks:
+{AI_TASKS}
+Guidelines:
+{AI_GUIDELINES}
+- Never mix information between articles.
+- Format the output as a JSON array with one object per article. Each object has four keys: "id" (the article number), "title", "summary", and "description".
+{article_blocks}"""
+
+        results: Dict[int, Dict[str, str]] = {}
+        try:
+            response = await _get_ai_model().generate_content_async(
+                prompt, generation_config={"response_mime_type": "application/json"}
+            )
+            json_text = response.text.strip().lstrip("```json").rstrip("```")
+            entries = json.loads(json_text)
+            ids = [entry.get("id") for entry in entries]
+            if len(ids) != len(articles) or set(ids) != set(range(len(articles))):
+                raise ValueError(f"answer ids {ids} do not match the {len(articles)} articles")
+            for entry in entries:
+                fields = {key: entry.get(key) for key in ("title", "summary", "description")}
+                if all(isinstance(value, str) and value for value in fields.values()):
+                    results[entry["id"]] = fields
+        except Exception as e:
+            print(f"Batched AI request failed, falling back to single requests: {e}")
+
+        missing = [i for i in range(len(articles)) if i not in results]
+        fallbacks = await asyncio.gather(*(self._get_ai_content(*articles[i]) for i in missing))
+        results.update(zip(missing, fallbacks))
+        return [results[i] for i in range(len(articles))]
     
-    async def _handle_image(self, html: str, title: str, base_url: str) -> str:
-        soup = BeautifulSoup(html, 'lxml')
-        og_image_tag = soup.find('meta', property='og:image')
-        if og_image_tag and og_image_tag.get('content'):
-            image_url = urljoin(base_url, og_image_tag['content'])
+    async def _handle_image(self, image_url: Optional[str], title: str) -> StoredImage:
+        if image_url:
             try:
-                response = await self.client.get(image_url)
-                response.raise_for_status()
-                return await self._save_image(response.content)
+                return await self._store_remote_image(image_url)
             except Exception as e:
                 print(f"Failed to download og:image {image_url}: {e}")
         
         if settings.PEXELS_API_KEY:
             try:
-                headers = {"Authorization": settings.PEXELS_API_KEY}
-                params = {"query": title, "per_page": 1, "orientation": "landscape"}
-                res = await self.client.get("https://api.pexels.com/v1/search", headers=headers, params=params)
-                res.raise_for_status()
-                data = res.json()
-                if data.get("photos"):
-                    pexels_url = data["photos"][0]["src"]["large"]
-                    response = await self.client.get(pexels_url)
-                    response.raise_for_status()
-                    return await self._save_image(response.content)
+                # Cached and budgeted; None once the budget is spent.
+                pexels_url = await pexels_search.find_photo_url(self.scheduler, title)
+                if pexels_url:
+                    return await self._store_remote_image(pexels_url)
             except Exception as e:
                 print(f"Pexels search failed: {e}")
 
         return await self._create_placeholder_image(title)
 
-    async def _save_image(self, image_bytes: bytes, max_width: int = 1200) -> str:
-        loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(None, self._process_and_save_image, image_bytes, max_width)
+    async def _store_remote_image(self, image_url: str) -> StoredImage:
+        """Returns the stored copy of a remote image, downloading it only if it is new."""
+        return await self._image_once(image_url, partial(self._download_image, image_url))
 
-    def _process_and_save_image(self, image_bytes: bytes, max_width: int) -> str:
-        img = Image.open(io.BytesIO(image_bytes)).convert("RGB")
-        
-        if img.width > max_width:
-            ratio = max_width / img.width
-            new_height = int(img.height * ratio)
-            img = img.resize((max_width, new_height), Image.Resampling.LANCZOS)
-        
-        buffer = io.BytesIO()
-        img.save(buffer, "JPEG", quality=85, optimize=True)
-        buffer.seek(0)
-        
-        filename = f"{uuid.uuid4()}.jpg"
+    async def _download_image(self, image_url: str) -> StoredImage:
+        async with self._db_lock:
+            stored = await find_image_by_url(self.db, image_url)
+        if stored:
+            self._state.image_registry_hits += 1
+            return stored
+        response = await self.scheduler.get(image_url)
+        response.raise_for_status()
+        image_bytes = response.content
+        content_hash = image_content_hash(image_bytes)
+        stored = await self._image_once(
+            content_hash, partial(self._save_new_image, image_bytes, content_hash, image_url)
+        )
+        # The same bytes may have been stored for another URL; record this one too.
+        async with self._db_lock:
+            await register_image(self.db, image_url, content_hash, stored)
+        return stored
 
-        if self.r2_client and settings.R2_BUCKET_NAME and settings.R2_PUBLIC_URL:
-            try:
-                self.r2_client.upload_fileobj(
-                    buffer,
-                    settings.R2_BUCKET_NAME,
-                    filename,
-                    ExtraArgs={'ContentType': 'image/jpeg'}
-                )
-                print(f"Successfully uploaded {filename} to R2.")
-                return f"{settings.R2_PUBLIC_URL}/{filename}"
-            except Exception as e:
-                print(f"Error uploading to R2: {e}. Falling back to local storage.")
+    async def _store_image_bytes(self, image_bytes: bytes) -> StoredImage:
+        """Saves a generated image unless identical bytes are already stored."""
+        content_hash = image_content_hash(image_bytes)
+        return await self._image_once(content_hash, partial(self._save_new_image, image_bytes, content_hash))
 
-        os.makedirs("static/images/posts", exist_ok=True)
-        save_path = os.path.join("static", "images", "posts", filename)
-        with open(save_path, "wb") as f:
-            f.write(buffer.getvalue())
-        return f"/static/images/posts/{filename}"
+    async def _save_new_image(self, image_bytes: bytes, content_hash: str, source_url: Optional[str] = None) -> StoredImage:
+        """Resizes and uploads the image unless identical bytes are already registered."""
+        async with self._db_lock:
+            stored = await find_image_by_hash(self.db, content_hash)
+        if stored:
+            self._state.image_registry_hits += 1
+            return stored
+        stored = await self._save_image(image_bytes)
+        async with self._db_lock:
+            await register_image(self.db, source_url, content_hash, stored)
+        return stored
 
-    async def _create_placeholder_image(self, text: str) -> str:
-        loop = asyncio.get_running_loop()
-        image_bytes = await loop.run_in_executor(None, self._generate_placeholder_bytes, text)
-        return await self._save_image(image_bytes)
+    async def _image_once(self, key: str, store) -> StoredImage:
+        """
+        Runs `store` once per key (image URL or content hash) in this run;
+        articles sharing an image await the same task.
+        """
+        task = self._image_tasks.get(key)
+        if task is None:
+            task = self._image_tasks[key] = asyncio.ensure_future(store())
+        return await task
 
-    def _generate_placeholder_bytes(self, text: str) -> bytes:
-        width, height = 1200, 675
-        img = Image.new('RGB', (width, height), color=(50, 50, 60))
-        d = ImageDraw.Draw(img)
-        try:
-            font = ImageFont.truetype("arial.ttf", 40)
-        except IOError:
-            font = ImageFont.load_default()
-
-        words = text.split()
-        lines = []
-        current_line = ""
-        for word in words:
-            if d.textlength(current_line + word, font=font) <= width - 60:
-                current_line += word + " "
+    async def _save_image(self, image_bytes: bytes) -> StoredImage:
+        """Renders the responsive variants from a single decode and uploads them concurrently."""
+        loop = asyncio.get_running_loop()
+        variants = await loop.run_in_executor(
+            None, partial(
+                render_variants, image_bytes, self.image_widths,
+                webp_quality=settings.FETCHER_IMAGE_WEBP_QUALITY, jpeg_quality=settings.FETCHER_IMAGE_JPEG_QUALITY,
+            )
+        )
+        name = uuid.uuid4()
+        with self.metrics.time("upload"):
+            urls = await object_uploader.upload_many([
+                (f"{name}-{variant.width}.{variant.extension}", variant.data, variant.content_type)
+                for variant in variants
+            ])
+        image = StoredImage(url="")
+        for variant, url in zip(variants, urls):
+            if variant.format == "jpeg":
+                image.url = url
             else:
-                lines.append(current_line.strip())
-                current_line = word + " "
-        lines.append(current_line.strip())
-
-        y_text = (height - len(lines) * 45) // 2
-        for line in lines[:5]:
-            text_width = d.textlength(line, font=font)
-            d.text(((width - text_width) / 2, y_text), line, font=font, fill=(200, 200, 210))
-            y_text += 45
-        
-        buffer = io.BytesIO()
-        img.save(buffer, "JPEG")
-        return buffer.getvalue()
\ No newline at end of file
+                image.variants.append({"url": url, "width": variant.width, "format": variant.format})
+        return image
+
+    async def _create_placeholder_image(self, text: str) -> StoredImage:
+        image_bytes = placeholder_renderer.cached(text)
+        if image_bytes is None:
+            loop = asyncio.get_running_loop()
+            image_bytes = await loop.run_in_executor(None, placeholder_renderer.render, text)
+        return await self._store_image_bytes(image_bytes)
@@ -0,0 +1,155 @@
+import asyncio
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Deque, List, Optional, Tuple
+
+import boto3
+from botocore.client import Config
+
+from app.core.config import settings
+from app.schemas.post import UploadStats
+from app.services.fetch_metrics import percentile
+
+LOCAL_IMAGE_DIR = os.path.join("static", "images", "posts")
+
+
+class ObjectUploader:
+    """
+    Stores post images in Cloudflare R2, or under static/images/posts when R2
+    is not configured. One S3 client (whose connection pool matches the
+    transfer pool) is shared by every fetch job, and uploads run on a
+    dedicated, bounded thread pool so they never queue behind image decoding
+    in the default executor. Failed uploads are retried with exponential
+    backoff before falling back to local storage.
+    """
+
+    def __init__(self, max_workers: int, max_attempts: int, backoff: float, latency_window: int = 500):
+        self.max_workers = max_workers
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self._client = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._client_lock = threading.Lock()
+        # Metrics; counters are only touched from the event loop, except
+        # `_queued`/`_active` which transfer threads update under `_lock`.
+        self._queued = 0
+        self._active = 0
+        self.completed = 0
+        self.failed = 0
+        self.retries = 0
+        self._latencies: Deque[float] = deque(maxlen=latency_window)
+
+    @property
+    def uses_r2(self) -> bool:
+        return all([
+            settings.R2_ACCOUNT_ID, settings.R2_ACCESS_KEY_ID, settings.R2_SECRET_ACCESS_KEY,
+            settings.R2_BUCKET_NAME, settings.R2_PUBLIC_URL,
+        ])
+
+    def _get_client(self):
+        with self._client_lock:
+            if self._client is None:
+                self._client = self._create_client()
+        return self._client
+
+    def _create_client(self):
+        return boto3.client(
+            's3',
+            endpoint_url=f'https://{settings.R2_ACCOUNT_ID}.r2.cloudflarestorage.com',
+            aws_access_key_id=settings.R2_ACCESS_KEY_ID,
+            aws_secret_access_key=settings.R2_SECRET_ACCESS_KEY,
+            # Retries are handled in upload(), so backing off does not hold
+            # a transfer thread.
+            config=Config(
+                signature_version='s3v4', max_pool_connections=self.max_workers,
+                retries={"max_attempts": 1, "mode": "standard"},
+            ),
+        )
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="r2-upload")
+        return self._executor
+
+    async def upload(self, key: str, data: bytes, content_type: str) -> str:
+        """Stores one object and returns its public URL."""
+        started = time.perf_counter()
+        try:
+            if self.uses_r2:
+                for attempt in range(self.max_attempts):
+                    try:
+                        await self._run(self._put_r2, key, data, content_type)
+                        return f"{settings.R2_PUBLIC_URL}/{key}"
+                    except Exception as e:
+                        if attempt + 1 == self.max_attempts:
+                            self.failed += 1
+                            print(f"Error uploading {key} to R2: {e}. Falling back to local storage.")
+                            break
+                        self.retries += 1
+                        await asyncio.sleep(self.backoff * (2 ** attempt))
+            await self._run(self._write_local, key, data)
+            return f"/static/images/posts/{key}"
+        finally:
+            self.completed += 1
+            self._latencies.append(time.perf_counter() - started)
+
+    async def upload_many(self, objects: List[Tuple[str, bytes, str]]) -> List[str]:
+        """Uploads (key, data, content_type) objects concurrently, returning URLs in order."""
+        return list(await asyncio.gather(*(self.upload(*obj) for obj in objects)))
+
+    def stats(self) -> UploadStats:
+        latencies = sorted(self._latencies)
+        return UploadStats(
+            queue_depth=self._queued, in_flight=self._active,
+            completed=self.completed, failed=self.failed, retries=self.retries,
+            p50_ms=percentile(latencies, 0.50) * 1000, p95_ms=percentile(latencies, 0.95) * 1000,
+        )
+
+    async def _run(self, func, *args):
+        with self._lock:
+            self._queued += 1
+        future = self._get_executor().submit(self._tracked, func, *args)
+        try:
+            return await asyncio.wrap_future(future)
+        finally:
+            # A transfer cancelled before it started never reaches _tracked().
+            if future.cancelled():
+                with self._lock:
+                    self._queued -= 1
+
+    def _tracked(self, func, *args):
+        with self._lock:
+            self._queued -= 1
+            self._active += 1
+        try:
+            return func(*args)
+        finally:
+            with self._lock:
+                self._active -= 1
+
+    def _put_r2(self, key: str, data: bytes, content_type: str):
+        self._get_client().put_object(
+            Bucket=settings.R2_BUCKET_NAME, Key=key, Body=data, ContentType=content_type,
+        )
+
+    @staticmethod
+    def _write_local(key: str, data: bytes):
+        os.makedirs(LOCAL_IMAGE_DIR, exist_ok=True)
+        with open(os.path.join(LOCAL_IMAGE_DIR, key), "wb") as f:
+            f.write(data)
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+object_uploader = ObjectUploader(
+    max_workers=settings.FETCHER_UPLOAD_WORKERS,
+    max_attempts=settings.FETCHER_UPLOAD_MAX_ATTEMPTS,
+    backoff=settings.FETCHER_UPLOAD_BACKOFF_SECONDS,
+)
@@ -0,0 +1,52 @@
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional
+
+from app.core.config import settings
+
+# Execution modes for CPU-bound parsing (trafilatura, lxml, BeautifulSoup):
+#   "process" - a shared process pool, so parsing uses every core and never
+#               holds the GIL of the worker serving API requests
+#   "thread"  - the event loop's default thread pool
+
+_process_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _get_executor() -> Optional[Executor]:
+    global _process_pool
+    if settings.FETCHER_PARSE_MODE != "process":
+        return None
+    if _process_pool is None:
+        # "spawn" avoids forking a process that already runs an event loop
+        # and several threads.
+        _process_pool = ProcessPoolExecutor(
+            max_workers=settings.FETCHER_PARSE_PROCESSES or os.cpu_count(),
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _process_pool
+
+
+async def run_parse(func: Callable[..., Any], *args: Any) -> Any:
+    """
+    Runs a parsing function off the event loop. `func` must be a module-level
+    function taking and returning picklable values.
+    """
+    global _process_pool
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(_get_executor(), func, *args)
+    except BrokenProcessPool:
+        # A crashed worker (e.g. OOM on a huge page) poisons the whole pool;
+        # drop it so the next call starts a fresh one.
+        _process_pool = None
+        raise
+
+
+def shutdown_parse_pool():
+    global _process_pool
+    if _process_pool is not None:
+        _process_pool.shutdown(wait=False, cancel_futures=True)
+        _process_pool = None
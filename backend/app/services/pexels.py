@@ -0,0 +1,146 @@
+import asyncio
+import hashlib
+import json
+import os
+import re
+import time
+from collections import deque
+from typing import Deque, Dict, Optional
+
+from app.core.config import settings
+from app.services.host_scheduler import HostScheduler
+
+PEXELS_SEARCH_URL = "https://api.pexels.com/v1/search"
+
+# Words that say nothing about what a stock photo should show.
+QUERY_STOPWORDS = frozenset("""
+    a about after against amid an and are as at be before by for from has have he her his how i in into is it its
+    latest more most new of on or our over report reports said says she than that the their they this to up update
+    was we were what when who why will with you
+""".split())
+QUERY_MAX_WORDS = 5
+
+_WORD = re.compile(r"[a-z][a-z-]+")
+_MISS = object()
+
+
+def normalize_query(title: str) -> str:
+    """
+    Reduces a headline to its first few distinctive words, so related
+    headlines share one search (and one cache entry) and Pexels gets a
+    query it can actually match.
+    """
+    words = []
+    for word in _WORD.findall(title.lower()):
+        if word not in QUERY_STOPWORDS and word not in words:
+            words.append(word)
+        if len(words) == QUERY_MAX_WORDS:
+            break
+    return " ".join(words)
+
+
+class RequestBudget:
+    """Allows at most `max_requests` per rolling `window` seconds."""
+
+    def __init__(self, max_requests: int, window: float):
+        self.max_requests = max_requests
+        self.window = window
+        self._sent: Deque[float] = deque()
+        self._blocked_until = 0.0
+
+    def try_acquire(self) -> bool:
+        now = time.time()
+        while self._sent and self._sent[0] <= now - self.window:
+            self._sent.popleft()
+        if now < self._blocked_until or len(self._sent) >= self.max_requests:
+            return False
+        self._sent.append(now)
+        return True
+
+    def block_until(self, timestamp: float):
+        """Stops spending until `timestamp`, e.g. when the API reports no quota left."""
+        self._blocked_until = max(self._blocked_until, timestamp)
+
+
+class PexelsSearch:
+    """
+    Finds a stock photo for a headline. Search results (including "no
+    photo") are cached on disk for `ttl` seconds under a hash of the
+    normalized query, and live searches are limited by a request budget.
+    When neither the cache nor the budget can answer, callers fall back to
+    a placeholder. Downloaded photos are deduplicated by the image registry.
+    """
+
+    def __init__(self, cache_dir: str, ttl: float, budget: RequestBudget):
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.budget = budget
+        self.cache_hits = 0
+        self.searches = 0
+        self.over_budget = 0
+        self._in_flight: Dict[str, asyncio.Future] = {}
+
+    async def find_photo_url(self, scheduler: HostScheduler, title: str) -> Optional[str]:
+        query = normalize_query(title)
+        if not query:
+            return None
+        cached = self._read(query)
+        if cached is not _MISS:
+            self.cache_hits += 1
+            return cached
+        # Headlines normalizing to the same query share one live search.
+        search = self._in_flight.get(query)
+        if search is None:
+            if not self.budget.try_acquire():
+                self.over_budget += 1
+                return None
+            search = self._in_flight[query] = asyncio.ensure_future(self._search(scheduler, query))
+            search.add_done_callback(lambda _: self._in_flight.pop(query, None))
+        return await search
+
+    async def _search(self, scheduler: HostScheduler, query: str) -> Optional[str]:
+        self.searches += 1
+        response = await scheduler.get(
+            PEXELS_SEARCH_URL, headers={"Authorization": settings.PEXELS_API_KEY},
+            params={"query": query, "per_page": 1, "orientation": "landscape"},
+        )
+        self._track_quota(response.headers)
+        response.raise_for_status()
+        photos = response.json().get("photos") or []
+        photo_url = photos[0]["src"]["large"] if photos else None
+        self._write(query, photo_url)
+        return photo_url
+
+    def _track_quota(self, headers):
+        remaining, reset = headers.get("x-ratelimit-remaining"), headers.get("x-ratelimit-reset")
+        if remaining == "0" and reset and reset.isdigit():
+            self.budget.block_until(float(reset))
+
+    def _path(self, query: str) -> str:
+        return os.path.join(self.cache_dir, hashlib.sha256(query.encode("utf-8")).hexdigest() + ".json")
+
+    def _read(self, query: str):
+        try:
+            with open(self._path(query), encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return _MISS
+        if time.time() - entry.get("stored_at", 0) > self.ttl:
+            return _MISS
+        return entry.get("photo_url")
+
+    def _write(self, query: str, photo_url: Optional[str]):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self._path(query)
+        # Write-then-rename, so a concurrent reader never sees a partial file.
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"query": query, "photo_url": photo_url, "stored_at": time.time()}, f)
+        os.replace(tmp_path, path)
+
+
+pexels_search = PexelsSearch(
+    cache_dir=settings.FETCHER_PEXELS_CACHE_DIR,
+    ttl=settings.FETCHER_PEXELS_CACHE_TTL_SECONDS,
+    budget=RequestBudget(settings.FETCHER_PEXELS_REQUESTS_PER_HOUR, window=3600),
+)
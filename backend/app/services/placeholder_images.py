@@ -0,0 +1,117 @@
+import hashlib
+import io
+import threading
+import unicodedata
+from collections import OrderedDict
+from typing import List, Optional
+
+from PIL import Image, ImageDraw, ImageFont
+
+from app.core.config import settings
+
+# Fonts tried in order; Pillow's bundled font is the last resort.
+PLACEHOLDER_FONTS = ("arial.ttf", "DejaVuSans.ttf")
+
+
+class PlaceholderRenderer:
+    """
+    Renders the title card used when an article has no usable image. The
+    font and the blank background are prepared once, and rendered JPEGs are
+    kept in an LRU cache keyed by a hash of the normalized title, so repeated
+    fallback titles cost nothing. Safe to call from several threads.
+    """
+
+    def __init__(
+        self, cache_size: int, width: int = 1200, height: int = 675,
+        font_size: int = 40, line_height: int = 45, max_lines: int = 5,
+        background=(50, 50, 60), text_color=(200, 200, 210),
+    ):
+        self.cache_size = cache_size
+        self.width = width
+        self.height = height
+        self.font_size = font_size
+        self.line_height = line_height
+        self.max_lines = max_lines
+        self.background = background
+        self.text_color = text_color
+        self._font: Optional[ImageFont.FreeTypeFont] = None
+        self._template: Optional[Image.Image] = None
+        self._cache: "OrderedDict[str, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def warm(self):
+        """Loads the font and background template; called at startup."""
+        with self._lock:
+            if self._font is None:
+                self._font = self._load_font()
+                self._template = Image.new("RGB", (self.width, self.height), color=self.background)
+
+    def cached(self, title: str) -> Optional[bytes]:
+        key = self._key(title)
+        with self._lock:
+            image_bytes = self._cache.get(key)
+            if image_bytes is not None:
+                self._cache.move_to_end(key)
+            return image_bytes
+
+    def render(self, title: str) -> bytes:
+        """Returns the JPEG title card for `title`, from the cache when possible."""
+        image_bytes = self.cached(title)
+        if image_bytes is not None:
+            return image_bytes
+        self.warm()
+        image_bytes = self._draw(self._normalize(title))
+        with self._lock:
+            self._cache[self._key(title)] = image_bytes
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return image_bytes
+
+    def _draw(self, title: str) -> bytes:
+        img = self._template.copy()
+        d = ImageDraw.Draw(img)
+        lines = self._wrap(title)[:self.max_lines]
+        y_text = (self.height - len(lines) * self.line_height) // 2
+        for line in lines:
+            text_width = self._font.getlength(line)
+            d.text(((self.width - text_width) / 2, y_text), line, font=self._font, fill=self.text_color)
+            y_text += self.line_height
+
+        buffer = io.BytesIO()
+        img.save(buffer, "JPEG")
+        return buffer.getvalue()
+
+    def _wrap(self, title: str) -> List[str]:
+        """Greedy word wrap; each word is measured once rather than every candidate line."""
+        max_width = self.width - 60
+        space = self._font.getlength(" ")
+        lines, current, current_width = [], [], 0.0
+        for word in title.split():
+            word_width = self._font.getlength(word)
+            needed = current_width + (space if current else 0) + word_width
+            if current and needed > max_width:
+                lines.append(" ".join(current))
+                current, current_width = [word], word_width
+            else:
+                current.append(word)
+                current_width = needed
+        lines.append(" ".join(current))
+        return lines
+
+    def _load_font(self) -> ImageFont.FreeTypeFont:
+        for name in PLACEHOLDER_FONTS:
+            try:
+                return ImageFont.truetype(name, self.font_size)
+            except IOError:
+                continue
+        return ImageFont.load_default(self.font_size)
+
+    @staticmethod
+    def _normalize(title: str) -> str:
+        return " ".join(unicodedata.normalize("NFC", title).split())
+
+    def _key(self, title: str) -> str:
+        return hashlib.sha256(self._normalize(title).encode("utf-8")).hexdigest()
+
+
+placeholder_renderer = PlaceholderRenderer(cache_size=settings.FETCHER_PLACEHOLDER_CACHE_SIZE)
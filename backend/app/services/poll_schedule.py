@@ -0,0 +1,25 @@
+import random
+from datetime import datetime, timedelta
+from typing import Optional
+
+from app.core.config import settings
+from app.models.news import NewsSource
+
+
+def update_poll_schedule(source: NewsSource, new_posts: int, now: Optional[datetime] = None):
+    """
+    Adapts a source's polling interval to its yield: a poll that produced new
+    posts halves the interval, an empty one stretches it by half, within the
+    configured bounds. Jitter keeps sources from being polled in lockstep.
+    """
+    now = now or datetime.utcnow()
+    interval = source.poll_interval_seconds or settings.FETCHER_SCHEDULER_INITIAL_INTERVAL_SECONDS
+    interval = interval / 2 if new_posts > 0 else interval * 1.5
+    interval = int(min(
+        settings.FETCHER_SCHEDULER_MAX_INTERVAL_SECONDS,
+        max(settings.FETCHER_SCHEDULER_MIN_INTERVAL_SECONDS, interval),
+    ))
+    jitter = random.uniform(-settings.FETCHER_SCHEDULER_JITTER, settings.FETCHER_SCHEDULER_JITTER)
+    source.poll_interval_seconds = interval
+    source.last_polled_at = now
+    source.next_poll_at = now + timedelta(seconds=interval * (1 + jitter))
@@ -0,0 +1,145 @@
+import gzip
+import heapq
+import io
+import re
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Iterable, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from lxml import etree
+
+# Pure parsing helpers for sitemap discovery. Like link_discovery, they take
+# and return plain values so they can run in a worker process.
+
+_GZIP_MAGIC = b"\x1f\x8b"
+
+
+@dataclass
+class SitemapLinks:
+    """Article URLs from a sitemap, or child sitemaps from a sitemap index."""
+    urls: List[str] = field(default_factory=list)
+    sitemaps: List[str] = field(default_factory=list)
+
+
+class SitemapTooLarge(ValueError):
+    """Raised when a gzipped sitemap decompresses past the byte limit."""
+
+
+def parse_robots_sitemaps(robots_txt: str) -> List[str]:
+    """Returns the Sitemap: entries of a robots.txt, news sitemaps first."""
+    sitemaps = []
+    for line in robots_txt.splitlines():
+        name, _, value = line.partition(":")
+        if name.strip().lower() == "sitemap" and value.strip():
+            sitemaps.append(value.strip())
+    return sorted(dict.fromkeys(sitemaps), key=lambda url: "news" not in url.lower())
+
+
+def parse_sitemap(
+    content: bytes, site_url: str, since: Optional[datetime], limit: int,
+    max_bytes: Optional[int] = None, blacklist: Iterable[str] = (),
+) -> SitemapLinks:
+    """
+    Streams a sitemap (or sitemap index, optionally gzipped) and returns the
+    `limit` most recent same-site entries modified after `since`. A date-only
+    entry counts as modified after `since` when it falls on the same day or
+    later, as its time of day is unknown. Entries without a date are kept; URL dedupe later in the pipeline drops the ones
+    already seen. Elements are freed as soon as they have been read.
+    Only http(s) pages and child sitemaps on the site's own host are
+    returned, pages skipped when their path contains a `blacklist` entry
+    (as in link discovery). A gzipped sitemap may decompress to at most
+    `max_bytes`.
+    """
+    if content[:2] == _GZIP_MAGIC:
+        stream = io.BytesIO(_gunzip(content, max_bytes))
+    else:
+        stream = io.BytesIO(content)
+
+    site_host = _host(site_url)
+    blacklist = list(blacklist)
+    blacklisted = re.compile("|".join(re.escape(part) for part in blacklist)).search if blacklist else None
+    pages: List[Tuple[datetime, str]] = []
+    children: List[Tuple[datetime, str]] = []
+    # Entities are never expanded, so they cannot inflate the document past
+    # the byte limits, and nothing is fetched from the network.
+    events = etree.iterparse(
+        stream, events=("end",), tag=("{*}url", "{*}sitemap"),
+        recover=True, resolve_entities=False, no_network=True,
+    )
+    for _, element in events:
+        loc, modified, date_only = None, None, False
+        namespace = etree.QName(element).namespace
+        for child in element.iter(tag=etree.Element):
+            qname = etree.QName(child)
+            name = qname.localname
+            # <image:loc> and friends share the local name; only the sitemap's own <loc> counts.
+            if name == "loc" and qname.namespace == namespace and child.text:
+                loc = child.text.strip()
+            elif name in ("lastmod", "publication_date") and child.text and modified is None:
+                value = child.text.strip()
+                modified, date_only = parse_w3c_datetime(value), _is_date_only(value)
+        is_index_entry = etree.QName(element).localname == "sitemap"
+
+        element.clear()
+        while element.getprevious() is not None:
+            del element.getparent()[0]
+
+        if not loc or not _modified_since(modified, date_only, since):
+            continue
+        parsed = urlparse(loc)
+        if parsed.scheme not in ("http", "https") or _host(loc) != site_host:
+            continue
+        entry = (modified or datetime.min, loc)
+        if is_index_entry:
+            children.append(entry)
+        elif blacklisted is None or not blacklisted(parsed.path):
+            # Bounded heap: memory stays at `limit` entries however big the sitemap.
+            if len(pages) < limit:
+                heapq.heappush(pages, entry)
+            else:
+                heapq.heappushpop(pages, entry)
+
+    return SitemapLinks(
+        urls=[loc for _, loc in sorted(pages, reverse=True)],
+        sitemaps=[loc for _, loc in sorted(children, reverse=True)],
+    )
+
+
+def _gunzip(content: bytes, max_bytes: Optional[int]) -> bytes:
+    with gzip.GzipFile(fileobj=io.BytesIO(content)) as stream:
+        if max_bytes is None:
+            return stream.read()
+        data = stream.read(max_bytes + 1)
+    if len(data) > max_bytes:
+        raise SitemapTooLarge(f"Sitemap decompresses to more than {max_bytes} bytes")
+    return data
+
+
+def _host(url: str) -> str:
+    host = urlparse(url).netloc.lower()
+    return host[4:] if host.startswith("www.") else host
+
+
+def _modified_since(modified: Optional[datetime], date_only: bool, since: Optional[datetime]) -> bool:
+    if since is None or modified is None:
+        return True
+    if date_only:
+        return modified.date() >= since.date()
+    return modified > since
+
+
+def _is_date_only(value: str) -> bool:
+    """True for a W3C date without a time of day, such as 2026-10-17."""
+    return "T" not in value.upper()
+
+
+def parse_w3c_datetime(value: str) -> Optional[datetime]:
+    """Parses a sitemap date (W3C datetime, date-only allowed) into naive UTC."""
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
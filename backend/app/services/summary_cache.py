@@ -0,0 +1,68 @@
+import hashlib
+import re
+from datetime import datetime, timedelta
+from typing import Dict, Iterable
+
+from sqlalchemy import select, update, delete
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.dialect import upsert_insert
+from app.models.news import AISummaryCache
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def summary_cache_key(text: str, prompt_version: str) -> str:
+    """
+    Hashes the article text after normalizing case and whitespace, so copies
+    of the same story that differ only in formatting share one entry.
+    """
+    normalized = _WHITESPACE.sub(" ", text).strip().lower()
+    return hashlib.sha256(f"{prompt_version}\n{normalized}".encode("utf-8")).hexdigest()
+
+
+async def get_cached_summaries(db: AsyncSession, keys: Iterable[str]) -> Dict[str, Dict[str, str]]:
+    """Looks up several keys at once and marks the hits as recently used."""
+    keys = set(keys)
+    if not keys:
+        return {}
+    result = await db.execute(select(AISummaryCache).where(AISummaryCache.content_hash.in_(keys)))
+    hits = {
+        entry.content_hash: {"title": entry.title, "summary": entry.summary, "description": entry.description}
+        for entry in result.scalars().all()
+    }
+    if hits:
+        await db.execute(
+            update(AISummaryCache)
+            .where(AISummaryCache.content_hash.in_(hits.keys()))
+            .values(last_used_at=datetime.utcnow())
+        )
+    return hits
+
+
+async def store_summaries(db: AsyncSession, entries: Dict[str, Dict[str, str]]):
+    """Adds new entries; a key written concurrently by another run is left as is."""
+    if not entries:
+        return
+    now = datetime.utcnow()
+    stmt = upsert_insert(db, AISummaryCache).values([
+        {
+            "content_hash": key, "title": content["title"], "summary": content["summary"],
+            "description": content["description"], "created_at": now, "last_used_at": now,
+        }
+        for key, content in entries.items()
+    ]).on_conflict_do_nothing(index_elements=["content_hash"])
+    await db.execute(stmt)
+
+
+async def evict_summaries(db: AsyncSession, max_entries: int, max_age_days: int):
+    """Drops entries unused for `max_age_days`, then the least recently used beyond `max_entries`."""
+    cutoff = datetime.utcnow() - timedelta(days=max_age_days)
+    await db.execute(delete(AISummaryCache).where(AISummaryCache.last_used_at < cutoff))
+    keep = (
+        select(AISummaryCache.content_hash)
+        .order_by(AISummaryCache.last_used_at.desc())
+        .limit(max_entries)
+        .scalar_subquery()
+    )
+    await db.execute(delete(AISummaryCache).where(AISummaryCache.content_hash.not_in(keep)))
@@ -0,0 +1,68 @@
+import codecs
+import re
+from typing import Optional
+
+from charset_normalizer import from_bytes
+
+# Only the start of a document is searched for a declared charset, and only
+# a prefix is handed to detection when nothing is declared.
+META_SNIFF_BYTES = 2048
+DETECTION_SAMPLE_BYTES = 64 * 1024
+
+_BOMS = (
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+_HEADER_CHARSET = re.compile(r"charset\s*=\s*[\"']?([\w.:-]+)", re.I)
+# Matches <meta charset="..."> as well as the http-equiv Content-Type form.
+_META_CHARSET = re.compile(rb"<meta[^>]+charset\s*=\s*[\"']?\s*([\w.:-]+)", re.I)
+_XML_ENCODING = re.compile(rb"<\?xml[^>]+encoding\s*=\s*[\"']([\w.:-]+)", re.I)
+
+
+def decode_body(content: bytes, content_type: str = "") -> str:
+    """
+    Decodes a response body using the cheapest reliable source of its charset:
+    the Content-Type header, a BOM, then an in-document declaration. Statistical
+    detection only runs when none of those is present.
+    """
+    encoding = (
+        _bom_encoding(content)
+        or _known_encoding(_first_group(_HEADER_CHARSET.search(content_type)))
+        or _declared_encoding(content[:META_SNIFF_BYTES])
+    )
+    if encoding is None:
+        match = from_bytes(content[:DETECTION_SAMPLE_BYTES]).best()
+        encoding = match.encoding if match else "utf-8"
+    return content.decode(encoding, errors="replace")
+
+
+def _bom_encoding(content: bytes) -> Optional[str]:
+    for bom, encoding in _BOMS:
+        if content.startswith(bom):
+            return encoding
+    return None
+
+
+def _declared_encoding(head: bytes) -> Optional[str]:
+    for pattern in (_XML_ENCODING, _META_CHARSET):
+        match = pattern.search(head)
+        if match:
+            return _known_encoding(match.group(1).decode("ascii", "ignore"))
+    return None
+
+
+def _known_encoding(name: Optional[str]) -> Optional[str]:
+    """Normalizes a charset label, ignoring ones Python cannot decode."""
+    if not name:
+        return None
+    try:
+        return codecs.lookup(name).name
+    except LookupError:
+        return None
+
+
+def _first_group(match) -> Optional[str]:
+    return match.group(1) if match else None
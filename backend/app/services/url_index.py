@@ -0,0 +1,66 @@
+import asyncio
+import hashlib
+from typing import Iterable, List
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.user import Post
+
+
+class KnownUrlIndex:
+    """
+    In-process set of article URLs that already exist as Posts.
+
+    Only positives are kept: a URL found here is definitely a duplicate and can
+    be rejected without touching the database, while a miss still has to be
+    confirmed against `posts`. URLs are stored as 64-bit BLAKE2 digests to keep
+    the index small, and a plain set (rather than a Bloom filter) is used so
+    that deleted posts can be removed again.
+    """
+
+    def __init__(self):
+        self._digests = set()
+        self._warmed = False
+        self._warm_lock = asyncio.Lock()
+
+    @staticmethod
+    def _digest(url: str) -> int:
+        return int.from_bytes(hashlib.blake2b(url.encode("utf-8"), digest_size=8).digest(), "big")
+
+    async def warm(self, db: AsyncSession):
+        """Loads every existing post URL once per process."""
+        async with self._warm_lock:
+            if self._warmed:
+                return
+            result = await db.stream_scalars(select(Post.source_url).execution_options(yield_per=5000))
+            async for url in result:
+                self._digests.add(self._digest(url))
+            self._warmed = True
+
+    def __contains__(self, url: str) -> bool:
+        return self._digest(url) in self._digests
+
+    def add_many(self, urls: Iterable[str]):
+        self._digests.update(self._digest(url) for url in urls)
+
+    def add(self, url: str):
+        self._digests.add(self._digest(url))
+
+    def discard(self, url: str):
+        self._digests.discard(self._digest(url))
+
+    def __len__(self) -> int:
+        return len(self._digests)
+
+
+async def find_existing_urls(db: AsyncSession, urls: List[str]) -> set:
+    """Returns the subset of `urls` that already exist as posts, in one query."""
+    if not urls:
+        return set()
+    result = await db.execute(select(Post.source_url).where(Post.source_url.in_(urls)))
+    return set(result.scalars().all())
+
+
+# Shared by every fetch run in this process.
+known_url_index = KnownUrlIndex()
@@ -0,0 +1,176 @@
+"""
+Recorded HTTP responses ("cassettes") for offline fetcher benchmarks, and a
+local HTTP server that replays them.
+
+A cassette is a JSON file mapping request paths to responses. Bodies may
+contain the placeholder BASE_URL_PLACEHOLDER, replaced by the server's own
+address when served, so recordings do not depend on the port.
+"""
+import base64
+import io
+import json
+import random
+import threading
+import time
+from dataclasses import dataclass
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List
+
+from PIL import Image, ImageDraw
+
+BASE_URL_PLACEHOLDER = "{{base_url}}"
+
+_WORDS = """
+    regulator agency safety inspection incident report fine penalty compliance audit hazard worker site
+    chemical spill emissions license review board court ruling investigation finding guidance standard
+    offshore pipeline refinery mine plant port rail aviation maritime fire explosion injury fatality
+    warning notice consultation policy framework risk assessment control measure training equipment
+    failure maintenance operator contractor employer union minister parliament committee evidence data
+""".split()
+
+
+@dataclass
+class Recording:
+    status: int
+    content_type: str
+    body: bytes
+
+    def to_json(self) -> dict:
+        return {
+            "status": self.status, "content_type": self.content_type,
+            "body_b64": base64.b64encode(self.body).decode("ascii"),
+        }
+
+    @classmethod
+    def from_json(cls, data: dict) -> "Recording":
+        return cls(data["status"], data["content_type"], base64.b64decode(data["body_b64"]))
+
+
+class Cassette:
+    """Responses by request path."""
+
+    def __init__(self, recordings: Dict[str, Recording] = None):
+        self.recordings = recordings or {}
+
+    def add(self, path: str, content_type: str, body, status: int = 200):
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        self.recordings[path] = Recording(status, content_type, body)
+
+    def save(self, file_path: str):
+        with open(file_path, "w", encoding="utf-8") as f:
+            json.dump({path: rec.to_json() for path, rec in self.recordings.items()}, f)
+
+    @classmethod
+    def load(cls, file_path: str) -> "Cassette":
+        with open(file_path, encoding="utf-8") as f:
+            return cls({path: Recording.from_json(rec) for path, rec in json.load(f).items()})
+
+    def feed_paths(self) -> List[str]:
+        return sorted(path for path, rec in self.recordings.items() if "xml" in rec.content_type)
+
+
+def build_corpus(name: str, sources: int, articles_per_source: int, image_ratio: float = 0.75, seed: int = 0) -> Cassette:
+    """
+    Synthesizes a cassette with `sources` RSS feeds, each listing
+    `articles_per_source` distinct articles. About `image_ratio` of the
+    articles carry an og:image (a unique JPEG); the rest get placeholders.
+    """
+    rng = random.Random(f"{name}:{seed}")
+    cassette = Cassette()
+    published = datetime(2025, 6, 1, tzinfo=timezone.utc)
+    for s in range(sources):
+        items = []
+        for a in range(articles_per_source):
+            path = f"/{name}/s{s}/articles/{a}-{'-'.join(rng.sample(_WORDS, 4))}"
+            title = " ".join(rng.sample(_WORDS, 8)).capitalize()
+            published += timedelta(minutes=7)
+            image_meta = ""
+            if rng.random() < image_ratio:
+                image_path = f"/{name}/s{s}/images/{a}.jpg"
+                cassette.add(image_path, "image/jpeg", _render_photo(rng))
+                image_meta = f'<meta property="og:image" content="{BASE_URL_PLACEHOLDER}{image_path}">'
+            paragraphs = "".join(
+                f"<p>{' '.join(rng.choice(_WORDS) for _ in range(rng.randint(40, 90))).capitalize()}.</p>"
+                for _ in range(rng.randint(4, 10))
+            )
+            cassette.add(path, "text/html; charset=utf-8", (
+                f'<html><head><title>{title}</title>{image_meta}'
+                f'<meta property="article:published_time" content="{published.isoformat()}"></head>'
+                f'<body><nav><a href="/">Home</a></nav><article><h1>{title}</h1>{paragraphs}</article>'
+                f'<footer>Copyright</footer></body></html>'
+            ))
+            items.append(
+                f"<item><title>{title}</title><link>{BASE_URL_PLACEHOLDER}{path}</link>"
+                f"<guid>{BASE_URL_PLACEHOLDER}{path}</guid><pubDate>{format_datetime(published)}</pubDate></item>"
+            )
+        cassette.add(f"/{name}/s{s}/feed.xml", "application/rss+xml", (
+            f'<?xml version="1.0" encoding="utf-8"?><rss version="2.0"><channel>'
+            f"<title>Source {s}</title><link>{BASE_URL_PLACEHOLDER}/{name}/s{s}/</link>{''.join(reversed(items))}"
+            f"</channel></rss>"
+        ))
+    return cassette
+
+
+def _render_photo(rng: random.Random) -> bytes:
+    """A unique 1600x900 JPEG, roughly the size of a news photo."""
+    img = Image.new("RGB", (1600, 900), tuple(rng.randrange(256) for _ in range(3)))
+    draw = ImageDraw.Draw(img)
+    for _ in range(12):
+        x, y = rng.randrange(1500), rng.randrange(800)
+        draw.rectangle((x, y, x + rng.randrange(50, 600), y + rng.randrange(50, 400)),
+                       fill=tuple(rng.randrange(256) for _ in range(3)))
+    buffer = io.BytesIO()
+    img.save(buffer, "JPEG", quality=85)
+    return buffer.getvalue()
+
+
+class CassetteServer:
+    """
+    Replays cassettes over HTTP on 127.0.0.1, adding `latency` seconds to
+    every response to mimic a remote publisher. Unknown paths return 404.
+    """
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.recordings: Dict[str, Recording] = {}
+        self.requests = 0
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                server.requests += 1
+                if server.latency:
+                    time.sleep(server.latency)
+                recording = server.recordings.get(self.path.split("?", 1)[0])
+                if recording is None:
+                    recording = Recording(404, "text/plain", b"not found")
+                body = recording.body.replace(BASE_URL_PLACEHOLDER.encode(), server.base_url.encode())
+                self.send_response(recording.status)
+                self.send_header("Content-Type", recording.content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._httpd.daemon_threads = True
+        self.base_url = f"http://127.0.0.1:{self._httpd.server_port}"
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="cassette-server", daemon=True)
+
+    def load(self, cassette: Cassette):
+        self.recordings.update(cassette.recordings)
+
+    def __enter__(self) -> "CassetteServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._httpd.shutdown()
+        self._httpd.server_close()
@@ -0,0 +1,166 @@
+"""
+Offline end-to-end benchmark for NewsFetcherService.
+
+Runs the real pipeline against local stand-ins only: a local HTTP server
+replaying feed, article and image cassettes, a fake Gemini model with
+configurable latency and an in-memory object store. Posts go to a SQLite
+database (or the database given with --database-url, e.g. a local
+Postgres). For each corpus size it reports articles/sec, p50/p95 latency
+per pipeline stage and peak Python memory. Run from backend/, with the
+development requirements (which add the SQLite driver) installed:
+
+    pip install -r requirements-dev.txt
+    python -m benchmarks.fetcher [--sizes 20 100 400] [--llm-latency 0.8]
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import resource
+import sys
+import tempfile
+import time
+import tracemalloc
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[20, 100, 400], help="articles per corpus")
+    parser.add_argument("--articles-per-source", type=int, default=10)
+    parser.add_argument("--cassette", action="append", default=[],
+                        help="replay a recorded cassette (JSON) instead of a synthetic corpus; may repeat")
+    parser.add_argument("--server-latency", type=float, default=0.05, help="seconds added to every HTTP response")
+    parser.add_argument("--llm-latency", type=float, default=0.8, help="seconds per Gemini request")
+    parser.add_argument("--llm-jitter", type=float, default=0.4)
+    parser.add_argument("--upload-latency", type=float, default=0.03, help="seconds per object store put")
+    parser.add_argument("--database-url", help="defaults to a temporary SQLite database")
+    parser.add_argument("--parse-mode", choices=["process", "thread"], default="process")
+    parser.add_argument("--json", dest="json_path", help="also write the results to this file")
+    return parser.parse_args()
+
+
+def configure_environment(args, workdir: str):
+    """Settings are read at import time, so they are set before importing the app."""
+    os.environ["DATABASE_URL"] = args.database_url or f"sqlite+aiosqlite:///{os.path.join(workdir, 'bench.db')}"
+    os.environ.setdefault("SECRET_KEY", "offline-benchmark")
+    os.environ["GOOGLE_API_KEY"] = "offline-benchmark"
+    os.environ["PEXELS_API_KEY"] = ""
+    os.environ["R2_PUBLIC_URL"] = "memory://objects"
+    os.environ["FETCHER_PARSE_MODE"] = args.parse_mode
+    os.environ["FETCHER_SCHEDULER_ENABLED"] = "false"
+    # Every cassette is served from 127.0.0.1, so per-host politeness would
+    # measure the politeness delay rather than the pipeline.
+    os.environ["FETCHER_MIN_HOST_DELAY_SECONDS"] = "0"
+    os.environ["FETCHER_MAX_CONNECTIONS_PER_HOST"] = "16"
+    os.environ["FETCHER_PEXELS_CACHE_DIR"] = os.path.join(workdir, "pexels")
+
+
+async def run_benchmark(args) -> list:
+    from sqlalchemy import func, select
+
+    from app.db.base import Base
+    from app.db.session import AsyncSessionLocal, engine
+    from app.models.news import NewsSource
+    from app.models.user import Post, Role, User
+    from app.services import news_fetcher_service
+    from app.services.http_transport import close_fetcher_client
+    from app.services.parse_pool import shutdown_parse_pool
+    from benchmarks.cassettes import Cassette, CassetteServer, build_corpus
+    from benchmarks.standins import FakeGeminiModel, InMemoryObjectUploader
+
+    engine.echo = False
+    model = news_fetcher_service._ai_model = FakeGeminiModel(args.llm_latency, args.llm_jitter)
+    uploader = news_fetcher_service.object_uploader = InMemoryObjectUploader(
+        put_latency=args.upload_latency, max_workers=8, max_attempts=3, backoff=0.5,
+    )
+
+    if args.cassette:
+        corpora = [("recorded", Cassette())]
+        for path in args.cassette:
+            corpora[0][1].recordings.update(Cassette.load(path).recordings)
+    else:
+        corpora = [
+            (f"c{size}", build_corpus(f"c{size}", math.ceil(size / args.articles_per_source), args.articles_per_source))
+            for size in args.sizes
+        ]
+
+    results = []
+    tracemalloc.start()
+    with CassetteServer(latency=args.server_latency) as server:
+        for name, cassette in corpora:
+            server.load(cassette)
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.drop_all)
+                await conn.run_sync(Base.metadata.create_all)
+            async with AsyncSessionLocal() as db:
+                user = User(email="bench@example.com", full_name="Benchmark", role=Role.SUPERADMIN)
+                db.add(user)
+                await db.flush()
+                for path in cassette.feed_paths():
+                    db.add(NewsSource(name=path.rsplit("/", 2)[-2], url=server.base_url + path, author_id=user.id))
+                await db.commit()
+
+            llm_before, requests_before, stored_before = model.requests, server.requests, len(uploader.objects)
+            tracemalloc.reset_peak()
+            started = time.perf_counter()
+            async with AsyncSessionLocal() as db:
+                service = news_fetcher_service.NewsFetcherService(db, user)
+                service.max_links_per_source = args.articles_per_source
+                async for event in service.run():
+                    last_event = event
+            elapsed = time.perf_counter() - started
+            _, peak = tracemalloc.get_traced_memory()
+
+            async with AsyncSessionLocal() as db:
+                posts = await db.scalar(select(func.count(Post.id)))
+            results.append({
+                "corpus": name, "sources": len(cassette.feed_paths()), "posts": posts,
+                "failed": service._state.failed, "seconds": round(elapsed, 2),
+                "articles_per_second": round(posts / elapsed, 2) if elapsed else 0.0,
+                "peak_python_mb": round(peak / 2 ** 20, 1),
+                "http_requests": server.requests - requests_before,
+                "llm_requests": model.requests - llm_before,
+                "objects_stored": len(uploader.objects) - stored_before,
+                "stages": {stage: timing.model_dump() for stage, timing in (last_event.metrics or {}).items()},
+            })
+
+    await close_fetcher_client()
+    shutdown_parse_pool()
+    uploader.shutdown()
+    await engine.dispose()
+    return results
+
+
+def print_report(results: list):
+    print(f"{'corpus':>10} {'sources':>7} {'posts':>6} {'failed':>6} {'seconds':>8} {'art/s':>7} {'peak MB':>8} "
+          f"{'HTTP':>6} {'LLM':>5} {'objects':>7}")
+    for r in results:
+        print(f"{r['corpus']:>10} {r['sources']:>7} {r['posts']:>6} {r['failed']:>6} {r['seconds']:>8.2f} "
+              f"{r['articles_per_second']:>7.2f} {r['peak_python_mb']:>8.1f} {r['http_requests']:>6} "
+              f"{r['llm_requests']:>5} {r['objects_stored']:>7}")
+    print()
+    print(f"{'corpus':>10} {'stage':>10} {'count':>6} {'p50 ms':>9} {'p95 ms':>9} {'total s':>8}  outcomes")
+    for r in results:
+        for stage, timing in r["stages"].items():
+            outcomes = ", ".join(f"{k}={v}" for k, v in sorted(timing["outcomes"].items()))
+            print(f"{r['corpus']:>10} {stage:>10} {timing['count']:>6} {timing['p50_ms']:>9.1f} "
+                  f"{timing['p95_ms']:>9.1f} {timing['total_seconds']:>8.2f}  {outcomes}")
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"\nPeak RSS of the benchmark process: {peak_rss:.0f} MB (parse workers not included).")
+
+
+def main():
+    args = parse_args()
+    with tempfile.TemporaryDirectory(prefix="fetcher-bench-") as workdir:
+        configure_environment(args, workdir)
+        sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        results = asyncio.run(run_benchmark(args))
+    print_report(results)
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
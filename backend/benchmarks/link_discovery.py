@@ -0,0 +1,85 @@
+"""
+Micro-benchmark for homepage link discovery.
+
+Compares the anchor-only LinkExtractor with the previous BeautifulSoup
+implementation on synthetic link-heavy homepages. Run from backend/:
+
+    python -m benchmarks.link_discovery [--anchors 500 2000 8000] [--repeat 20]
+"""
+import argparse
+import time
+from urllib.parse import urljoin, urlparse
+
+from bs4 import BeautifulSoup
+
+from app.services.link_discovery import PATH_BLACKLIST, parse_html_links
+
+SOURCE_URL = "https://news.example.com/"
+
+
+def legacy_parse_html_links(content: bytes, source_url: str, limit: int):
+    """The BeautifulSoup-based discovery this benchmark compares against."""
+    links = []
+    soup = BeautifulSoup(content, "lxml")
+    for a_tag in soup.find_all("a", href=True):
+        if len(links) >= limit:
+            break
+        full_url = urljoin(source_url, a_tag.get('href'))
+        parsed_url = urlparse(full_url)
+        if (parsed_url.scheme not in ('http', 'https') or
+            parsed_url.netloc != urlparse(source_url).netloc or
+            parsed_url.fragment or
+            full_url == source_url or
+            any(blacklisted in parsed_url.path for blacklisted in PATH_BLACKLIST) or
+            len(a_tag.get_text(strip=True).split()) < 5):
+            continue
+        if full_url not in links:
+            links.append(full_url)
+    return links
+
+
+def build_homepage(anchors: int) -> bytes:
+    """A homepage with navigation, tag links, off-site links and headlines."""
+    parts = ['<html><head><meta charset="utf-8"><title>News</title></head><body><nav>']
+    parts += [f'<a href="/tag/topic-{i}">Topic {i}</a>' for i in range(anchors // 10)]
+    parts.append('</nav><main>')
+    for i in range(anchors):
+        if i % 7 == 0:
+            href = f"https://ads.example.net/click?id={i}"
+        elif i % 3 == 0:
+            href = f"/2025/06/{i % 28 + 1:02d}/regulator-fines-company-over-incident-{i}"
+        else:
+            href = f"/world/story-{i}"
+        parts.append(
+            f'<article><h2><a href="{href}">Regulator issues <b>new</b> guidance on incident {i}</a></h2>'
+            f'<p>{"Background paragraph text. " * 5}</p></article>'
+        )
+    parts.append('</main></body></html>')
+    return "".join(parts).encode("utf-8")
+
+
+def time_call(func, content: bytes, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(content, SOURCE_URL, 10)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--anchors", type=int, nargs="+", default=[500, 2000, 8000])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'anchors':>8} {'page KB':>8} {'legacy ms':>10} {'extractor ms':>13} {'speedup':>8}")
+    for anchors in args.anchors:
+        content = build_homepage(anchors)
+        legacy = time_call(legacy_parse_html_links, content, args.repeat)
+        current = time_call(parse_html_links, content, args.repeat)
+        print(f"{anchors:>8} {len(content) // 1024:>8} {legacy * 1000:>10.2f} {current * 1000:>13.2f} {legacy / current:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Local stand-ins for the external services the fetcher talks to."""
+import asyncio
+import json
+import random
+import re
+import threading
+import time
+from typing import Dict
+
+from app.services.object_uploader import ObjectUploader
+
+_TITLE = re.compile(r'Original Title: "(.*)"')
+
+
+class FakeGeminiModel:
+    """
+    Answers summarization prompts like gemini's GenerativeModel, after
+    `latency` seconds (plus up to `jitter` more), for single and batched
+    prompts alike.
+    """
+
+    def __init__(self, latency: float, jitter: float = 0.0, seed: int = 0):
+        self.latency = latency
+        self.jitter = jitter
+        self.requests = 0
+        self._rng = random.Random(seed)
+
+    async def generate_content_async(self, prompt: str, generation_config=None):
+        self.requests += 1
+        await asyncio.sleep(self.latency + self._rng.random() * self.jitter)
+        answers = [
+            {"title": f"Summary: {title}", "summary": f"What happened: {title}.",
+             "description": f"{title}. A longer description of the article."}
+            for title in _TITLE.findall(prompt)
+        ]
+        if "[Article " in prompt:
+            text = json.dumps([dict(answer, id=i) for i, answer in enumerate(answers)])
+        else:
+            text = json.dumps(answers[0])
+        return _FakeResponse(text)
+
+
+class _FakeResponse:
+    def __init__(self, text: str):
+        self.text = text
+
+
+class InMemoryObjectUploader(ObjectUploader):
+    """
+    ObjectUploader whose "R2 bucket" is a dict, so the real transfer pool,
+    retries and metrics are exercised without network access. Each put
+    takes `put_latency` seconds on a transfer thread.
+    """
+
+    def __init__(self, put_latency: float = 0.0, **kwargs):
+        super().__init__(**kwargs)
+        self.put_latency = put_latency
+        self.objects: Dict[str, bytes] = {}
+        self._objects_lock = threading.Lock()
+
+    @property
+    def uses_r2(self) -> bool:
+        return True
+
+    def _put_r2(self, key: str, data: bytes, content_type: str):
+        if self.put_latency:
+            time.sleep(self.put_latency)
+        with self._objects_lock:
+            self.objects[key] = data
+
+    @property
+    def stored_bytes(self) -> int:
+        return sum(len(data) for data in self.objects.values())
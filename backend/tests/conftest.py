@@ -0,0 +1,7 @@
+import os
+
+# Settings are read at import time; the tests never touch a real database.
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+os.environ.setdefault("SECRET_KEY", "test-secret")
+# Parsing runs on the default thread pool instead of spawned processes.
+os.environ.setdefault("FETCHER_PARSE_MODE", "thread")
@@ -0,0 +1,56 @@
+import asyncio
+
+import httpx
+
+from app.services.circuit_breaker import CLOSED, OPEN, HostCircuitBreakers
+from app.services.host_scheduler import HostScheduler
+
+
+def _scheduler(statuses) -> HostScheduler:
+    """A scheduler whose host answers with `statuses` in turn (Retry-After: 0 on 503)."""
+    answers = iter(statuses)
+
+    def handler(request):
+        status = next(answers)
+        headers = {"retry-after": "0"} if status == 503 else {}
+        return httpx.Response(status, headers=headers, content=b"ok")
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    breakers = HostCircuitBreakers(failure_threshold=3, slow_threshold=10.0)
+    return HostScheduler(client, min_host_delay=0.0, max_retries=2, breakers=breakers)
+
+
+def test_503_then_200_does_not_open_the_circuit():
+    # The first get() is throttled on every attempt, the next one succeeds.
+    scheduler = _scheduler([503, 503, 503, 200])
+
+    async def run():
+        first = await scheduler.get("https://news.test/a")
+        assert scheduler.breakers.get("news.test").state == CLOSED
+        second = await scheduler.get("https://news.test/b")
+        return first, second
+
+    first, second = asyncio.run(run())
+    assert (first.status_code, second.status_code) == (503, 200)
+    breaker = scheduler.breakers.get("news.test")
+    assert breaker.state == CLOSED
+    assert breaker.failures == 0
+
+
+def test_503_retried_into_200_is_a_success():
+    scheduler = _scheduler([503, 200])
+    response = asyncio.run(scheduler.get("https://news.test/a"))
+    assert response.status_code == 200
+    assert scheduler.breakers.get("news.test").failures == 0
+
+
+def test_throttled_retries_count_as_one_failure():
+    scheduler = _scheduler([503] * 9)
+
+    async def run():
+        return [(await scheduler.get(f"https://news.test/{i}")).status_code for i in range(3)]
+
+    assert asyncio.run(run()) == [503, 503, 503]
+    breaker = scheduler.breakers.get("news.test")
+    assert breaker.failures == 3
+    assert breaker.state == OPEN
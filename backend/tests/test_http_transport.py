@@ -0,0 +1,30 @@
+import asyncio
+
+import pytest
+
+from app.services.http_transport import CachingResolverBackend
+
+
+class _SlowResolver(CachingResolverBackend):
+    """Resolves every host to 127.0.0.1 after a short delay."""
+
+    async def _lookup(self, host, port):
+        await asyncio.sleep(0.05)
+        self._cache[host] = (float("inf"), ["127.0.0.1"])
+        return ["127.0.0.1"]
+
+
+def test_cancelled_waiter_does_not_cancel_the_shared_lookup():
+    resolver = _SlowResolver(backend=None, ttl=60)
+
+    async def run():
+        first = asyncio.create_task(resolver.resolve("news.test", 443))
+        second = asyncio.create_task(resolver.resolve("news.test", 443))
+        await asyncio.sleep(0)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return await second
+
+    assert asyncio.run(run()) == ["127.0.0.1"]
+    assert resolver.misses == 1
@@ -0,0 +1,50 @@
+import random
+
+from app.services.near_duplicates import NearDuplicateIndex, hamming_distance, simhash
+
+WORDS = [f"word{i}" for i in range(5000)]
+
+
+def _article(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+
+def test_syndicated_copy_with_header_and_footer_is_caught():
+    index = NearDuplicateIndex(max_distance=7)
+    caught = 0
+    for seed in range(50):
+        rng = random.Random(seed)
+        original = _article(rng, 500)
+        copy = f"{_article(rng, 12)} {original} {_article(rng, 15)}"
+        index.add_to_run(simhash(original), f"https://origin.test/{seed}")
+        if index.find_in_run(simhash(copy)) == f"https://origin.test/{seed}":
+            caught += 1
+    assert caught >= 40
+
+
+def test_every_fingerprint_within_max_distance_is_found():
+    rng = random.Random(1)
+    index = NearDuplicateIndex(max_distance=7)
+    fingerprint = rng.getrandbits(64)
+    index.add_to_run(fingerprint, "https://origin.test/")
+    for _ in range(500):
+        flipped = fingerprint
+        for bit in rng.sample(range(64), rng.randint(0, 7)):
+            flipped ^= 1 << bit
+        assert index.find_in_run(flipped) == "https://origin.test/"
+
+
+def test_unrelated_article_is_not_a_duplicate():
+    rng = random.Random(2)
+    index = NearDuplicateIndex(max_distance=7)
+    index.add_to_run(simhash(_article(rng, 500)), "https://origin.test/")
+    other = simhash(_article(rng, 500))
+    assert index.find_in_run(other) is None
+
+
+def test_distance_beyond_max_is_rejected():
+    index = NearDuplicateIndex(max_distance=7)
+    fingerprint = 0
+    index.add_to_run(fingerprint, "https://origin.test/")
+    assert hamming_distance(fingerprint, (1 << 8) - 1) == 8
+    assert index.find_in_run((1 << 8) - 1) is None
@@ -0,0 +1,50 @@
+import asyncio
+from datetime import datetime
+from types import SimpleNamespace
+
+import httpx
+
+from app.services.news_fetcher_service import NewsFetcherService
+
+INDEX = b"""<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+<sitemap><loc>https://news.test/sitemap-a.xml</loc></sitemap>
+<sitemap><loc>https://news.test/sitemap-b.xml</loc></sitemap>
+</sitemapindex>"""
+CHILD = b"""<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+<url><loc>https://news.test/2026/10/17/story-a</loc></url>
+</urlset>"""
+
+
+class _Scheduler:
+    """Serves the sitemap index and child A; child B times out."""
+
+    async def get(self, url, max_bytes=None, **kwargs):
+        request = httpx.Request("GET", url)
+        if url.endswith("sitemap-b.xml"):
+            raise httpx.ReadTimeout("timed out", request=request)
+        content = INDEX if url.endswith("sitemap.xml") else CHILD
+        return httpx.Response(200, content=content, request=request)
+
+
+def _service() -> NewsFetcherService:
+    service = NewsFetcherService.__new__(NewsFetcherService)
+    service.scheduler = _Scheduler()
+    service.max_links_per_source = 10
+    service._discovery_updates = {}
+    service._db_lock = asyncio.Lock()
+    service._run_started_at = datetime(2026, 10, 17, 12, 0)
+    return service
+
+
+def _source() -> SimpleNamespace:
+    return SimpleNamespace(
+        id=1, url="https://news.test/", sitemap_url="https://news.test/sitemap.xml",
+        etag=None, last_modified=None, content_hash=None, last_discovered_at=datetime(2026, 10, 17, 6, 0),
+    )
+
+
+def test_failed_child_sitemap_keeps_the_watermark():
+    service = _service()
+    links = asyncio.run(service._discover_sitemap_links(_source()))
+    assert [item.link for item in links] == ["https://news.test/2026/10/17/story-a"]
+    assert "last_discovered_at" not in service._discovery_updates.get(1, {})
@@ -0,0 +1,61 @@
+from datetime import datetime
+
+from app.services.sitemaps import parse_sitemap
+
+SITE = "https://news.test/"
+
+
+def _urlset(*entries) -> bytes:
+    urls = "".join(f"<url><loc>{loc}</loc><lastmod>{lastmod}</lastmod></url>" for loc, lastmod in entries)
+    return f'<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">{urls}</urlset>'.encode()
+
+
+def test_date_only_lastmod_from_the_same_day_is_kept():
+    content = _urlset(
+        ("https://news.test/today", "2026-10-17"),
+        ("https://news.test/yesterday", "2026-10-16"),
+    )
+    links = parse_sitemap(content, SITE, since=datetime(2026, 10, 17, 9, 0), limit=10)
+    assert links.urls == ["https://news.test/today"]
+
+
+def test_full_lastmod_is_compared_to_the_second():
+    content = _urlset(
+        ("https://news.test/after", "2026-10-17T10:00:00Z"),
+        ("https://news.test/before", "2026-10-17T08:00:00+00:00"),
+    )
+    links = parse_sitemap(content, SITE, since=datetime(2026, 10, 17, 9, 0), limit=10)
+    assert links.urls == ["https://news.test/after"]
+
+
+def test_pages_and_children_off_site_or_blacklisted_are_skipped():
+    content = _urlset(
+        ("https://news.test/2026/10/17/story", "2026-10-17"),
+        ("https://www.news.test/2026/10/17/other-story", "2026-10-17"),
+        ("https://elsewhere.test/2026/10/17/story", "2026-10-17"),
+        ("https://news.test/tag/politics/", "2026-10-17"),
+        ("ftp://news.test/file", "2026-10-17"),
+    )
+    links = parse_sitemap(content, SITE, since=None, limit=10, blacklist={"/tag/"})
+    assert sorted(links.urls) == [
+        "https://news.test/2026/10/17/story",
+        "https://www.news.test/2026/10/17/other-story",
+    ]
+
+    index = (
+        '<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+        "<sitemap><loc>https://news.test/sitemap-1.xml</loc></sitemap>"
+        "<sitemap><loc>https://attacker.test/sitemap.xml</loc></sitemap>"
+        "</sitemapindex>"
+    ).encode()
+    assert parse_sitemap(index, SITE, since=None, limit=10).sitemaps == ["https://news.test/sitemap-1.xml"]
+
+
+def test_entities_are_not_expanded():
+    content = b"""<?xml version="1.0"?>
+<!DOCTYPE urlset [<!ENTITY path "2026/10/17/injected-story">]>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+<url><loc>https://news.test/&path;</loc></url>
+</urlset>"""
+    links = parse_sitemap(content, SITE, since=None, limit=10)
+    assert "https://news.test/2026/10/17/injected-story" not in links.urls
@@ -1,6 +1,6 @@
 // filepath: frontend/src/components/NewsCard.tsx
 import React from 'react';
-import { Card, CardMedia, CardContent, Typography, CardActions, IconButton } from '@mui/material';
+import { Box, Card, CardMedia, CardContent, Typography, CardActions, IconButton } from '@mui/material';
 import DeleteIcon from '@mui/icons-material/Delete';
 import { Link } from 'react-router-dom';
 import { type Post } from '../types/news';
@@ -10,21 +10,27 @@ interface NewsCardProps {
   post: Post;
   userRole?: UserRole;
   onDelete: (postId: number) => void;
+  // Rendered width of the thumbnail, so the browser picks the smallest variant from image_srcset.
+  imageSizes?: string;
 }
 
-const NewsCard: React.FC<NewsCardProps> = ({ post, userRole, onDelete }) => {
+const NewsCard: React.FC<NewsCardProps> = ({ post, userRole, onDelete, imageSizes = '100vw' }) => {
   // The post.image_url from the API is now the complete, public URL from Cloudflare R2.
   // No need to prepend the API base URL.
 
   return (
     <Card sx={{ height: '100%', display: 'flex', flexDirection: 'column' }}>
-      <CardMedia
-        component={Link}
-        to={`/news/${post.id}`}
-        image={post.image_url} // Use the URL directly
-        title={post.title}
-        sx={{ height: 180, '&:hover': { opacity: 0.9 } }}
-      />
+      <Box component={Link} to={`/news/${post.id}`} sx={{ display: 'block', '&:hover': { opacity: 0.9 } }}>
+        <CardMedia
+          component="img"
+          src={post.image_url} // Use the URL directly
+          srcSet={post.image_srcset ?? undefined}
+          sizes={imageSizes}
+          alt={post.title}
+          loading="lazy"
+          sx={{ height: 180, objectFit: 'cover' }}
+        />
+      </Box>
       <CardContent sx={{ flexGrow: 1 }}>
         <Typography
           gutterBottom
@@ -84,6 +84,8 @@ const HomePage: React.FC = () => {
                 post={post}
                 userRole={user?.role}
                 onDelete={handleDelete}
+                // One, two or three columns (see gridTemplateColumns above) inside the lg container.
+                imageSizes="(max-width: 599px) 100vw, (max-width: 899px) 50vw, 400px"
               />
             </Box>
           ))}
@@ -108,6 +108,8 @@ const NewsDetailPage: React.FC = () => {
         <Box
           component="img"
           src={post.image_url} // Use the URL directly
+          srcSet={post.image_srcset ?? undefined}
+          sizes="(max-width: 900px) 100vw, 900px"
           alt={post.title}
           sx={{
             width: '100%',
@@ -18,6 +18,21 @@ import DeleteIcon from '@mui/icons-material/Delete';
 import { type FetchStatus, type NewsSource } from '../../types/news.ts';
 import apiClient from '../../api/apiClient.ts';
 
+// Shows a source's URL, plus its circuit breaker state when it is failing.
+const describeSource = (source: NewsSource): string => {
+  if (source.circuit_state === 'open' && source.circuit_open_until) {
+    const retryAt = new Date(`${source.circuit_open_until}Z`).toLocaleTimeString();
+    return `${source.url} · paused after ${source.consecutive_failures} failures, retrying after ${retryAt}`;
+  }
+  if (source.circuit_state === 'half_open') {
+    return `${source.url} · failing, retried on the next fetch`;
+  }
+  if (source.host_circuit_state === 'open') {
+    return `${source.url} · host unreachable, requests paused`;
+  }
+  return source.url;
+};
+
 const NewsFetcherPage: React.FC = () => {
   const [newSourceUrl, setNewSourceUrl] = useState<string>('');
   const [sources, setSources] = useState<NewsSource[]>([]);
@@ -218,7 +233,7 @@ const NewsFetcherPage: React.FC = () => {
                   <DeleteIcon />
                 </IconButton>
               }>
-                <ListItemText primary={source.name} secondary={source.url} />
+                <ListItemText primary={source.name} secondary={describeSource(source)} />
               </ListItem>
             ))}
           </List>
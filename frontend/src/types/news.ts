@@ -4,20 +4,36 @@ export interface Post {
   summary: string;
   description: string;
   image_url: string;
+  image_srcset?: string | null;
   source_name: string;
   source_url: string;
   published_date: string;
 }
 
+export interface StageTiming {
+  count: number;
+  outcomes: Record<string, number>;
+  total_seconds: number;
+  p50_ms: number;
+  p95_ms: number;
+}
+
 export interface FetchStatus {
   stage: string;
   progress: number;
   message: string;
   is_complete: boolean;
+  metrics?: Record<string, StageTiming> | null;
 }
 
+export type CircuitState = 'closed' | 'open' | 'half_open';
+
 export interface NewsSource {
   id: number;
   name: string;
   url: string;
+  circuit_state?: CircuitState;
+  consecutive_failures?: number;
+  circuit_open_until?: string | null;
+  host_circuit_state?: CircuitState;
 }
\ No newline at end of file